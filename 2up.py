@@ -30,14 +30,93 @@ Examples
 
 4-up with four sources (manual mode):
     python nup_pdf.py a.pdf b.pdf c.pdf d.pdf --mode 4up --manual-inputs
+
+ENGINES
+-------
+- pypdf (default): each source page becomes one form XObject, drawn in
+  every slot that shows it (pure Python, content is never duplicated).
+  Needs pypdf 3.0-6.x (see add_indirect).
+- mupdf: pages are placed with PyMuPDF's Page.show_pdf_page. Same slot
+  geometry, still vector output, much faster on large manuals:
+    python nup_pdf.py --engine mupdf
+
+STREAMING
+---------
+--chunk-sheets N builds and writes N sheets at a time into part files and
+merges them at the end, so memory stays flat on 1000+ page manuals. The
+peak memory of the run is printed at the end.
+    python nup_pdf.py --chunk-sheets 100
+
+BOOKLET
+-------
+--mode booklet imposes one PDF in saddle-stitch order on 2-up sheets
+(padded with blank pages to a multiple of 4), front and back of every
+sheet in turn, in a single pass. Print duplex, fold and staple:
+    python nup_pdf.py --mode booklet
+    python nup_pdf.py --mode booklet --back-rotate 180
+
+PAGE SELECTION
+--------------
+--pages and --sheets take ranges like "40-80" or "1-5,8,12-" (the
+print_settings.json syntax) and impose only those source pages / output
+sheets, so a partial reprint only reads the pages it needs:
+    python nup_pdf.py --pages 40-80
+
+PARALLEL
+--------
+--jobs N imposes chunks of sheets in N worker processes and merges the
+parts in order (each sheet only depends on page i of each source).
+--chunk-sheets then sets the chunk size (default: two chunks per job).
+    python nup_pdf.py --jobs 8
+
+OPTIMIZE
+--------
+--optimize rewrites the output once it is written: identical objects and
+streams are merged, every stream is compressed and (with PyMuPDF) objects
+go into object streams. The bytes saved and the time spent are printed.
+    python nup_pdf.py --optimize
+
+BATCH
+-----
+--batch imposes several PDFs without any question: inputs are folders,
+PDF files or titles searched in PDF_FOLDERS (--titles FILE reads them one
+per line). Files are imposed in a process pool (--jobs, default: CPU
+count) into --out-dir; outputs newer than their source are skipped unless
+--force. A summary with the time and size of every output ends the run.
+    python nup_pdf.py --batch --titles orders.txt --out-dir print
 """
 
+import io
 import os
 import sys
+import time
+import shutil
 import argparse
-from typing import List, Tuple
+import tempfile
+import functools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, NamedTuple, Optional, Sequence, Tuple
 
 from pypdf import PdfReader, PdfWriter, PageObject, Transformation
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    FloatObject,
+    NameObject,
+)
+
+# PyMuPDF is only needed for --engine mupdf
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+from pdf_catalog import find_pdfs
+# "1-5,8,12-" selections, same syntax as print_settings.json
+from page_ranges import parse_page_ranges
+import tool_progress
 
 PT_PER_IN = 72.0
 
@@ -46,11 +125,10 @@ SHEET_SIZES = {
     "a4": (595.0, 842.0),  # standard A4 size in PDF points
 }
 
-# Folders to search by default when looking for a PDF by partial name.
-PDF_FOLDERS = [
-    r"C:\Users\benoi\Downloads\ebay_manuals",
-    r"C:\Users\benoi\Downloads\manuals",
-]
+ENGINES = ["pypdf", "mupdf"]
+
+# --jobs without --chunk-sheets: chunks per worker process
+PARALLEL_CHUNKS_PER_JOB = 2
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -64,15 +142,7 @@ def find_pdf(partial_name: str) -> str:
     Returns:
         Full path to the selected file, or None if not found or cancelled.
     """
-    partial_name_lower = partial_name.lower()
-
-    matching_files = []
-    for folder in PDF_FOLDERS:
-        if not os.path.isdir(folder):
-            continue
-        for f in os.listdir(folder):
-            if f.lower().endswith(".pdf") and partial_name_lower in f.lower():
-                matching_files.append(os.path.join(folder, f))
+    matching_files = find_pdfs(partial_name)
 
     if not matching_files:
         print("No PDF found containing:", partial_name)
@@ -169,42 +239,25 @@ def interactive_pick(max_count: int) -> List[str]:
         return picks[:max_count]
 
 
-def compute_upright_size(page) -> Tuple[float, float, int]:
-    """
-    Return (visible_width, visible_height, rotation_deg).
-
-    If the page has a 90 or 270 degree rotation flag, width/height are swapped.
-    """
-    rot = getattr(page, "rotation", 0) or 0
-    w = float(page.mediabox.width)
-    h = float(page.mediabox.height)
-    if rot in (90, 270):
-        return h, w, rot
-    return w, h, rot
-
-
-def place_page(
-    new_page: PageObject,
-    src_page,
-    slot_x: float,
-    slot_y: float,
-    slot_w: float,
-    slot_h: float,
+def fit_in_slot(
+    src_w: float,
+    src_h: float,
+    slot: Tuple[float, float, float, float],
     zoom: float,
     align: str = "center",
-):
+) -> Tuple[float, float, float]:
     """
-    Merge src_page into new_page, scaled uniformly to fit inside the slot.
+    Return (scale, x_offset, y_offset) placing an upright src_w x src_h page
+    in slot = (x, y, w, h), in PDF coordinates (origin bottom-left).
 
     zoom is a factor applied on top of the best-fit scale. Values <= 1.0
     shrink the content. Values > 1.0 are clamped so that the page never
     exceeds the slot.
     """
+    slot_x, slot_y, slot_w, slot_h = slot
     if zoom <= 0:
         zoom = 1.0
 
-    src_w, src_h, rot = compute_upright_size(src_page)
-
     # Base uniform scale so the page fits inside the slot
     base_scale = min(slot_w / src_w, slot_h / src_h)
 
@@ -225,32 +278,246 @@ def place_page(
     # Horizontal alignment: always centered in the slot
     x_offset = slot_x + (slot_w - src_w * scale) / 2.0
 
-    t = Transformation()
+    return scale, x_offset, y_offset
+
+
+def page_geometry(src_page) -> Tuple[float, float, float, float, int]:
+    """(left, bottom, width, height, rotation) of src_page's MediaBox."""
+    mb = src_page.mediabox
+    rot = (getattr(src_page, "rotation", 0) or 0) % 360
+    return float(mb.left), float(mb.bottom), float(mb.width), float(mb.height), rot
+
+
+@functools.lru_cache(maxsize=256)
+def geometry_transform(geometry: Tuple[float, float, float, float, int], slot: Tuple[float, float, float, float],
+                       zoom: float, align: str = "center") -> Transformation:
+    """
+    slot_transform for a page geometry. Memoized: a manual usually has one
+    page size, so every sheet reuses the same few transformations.
+    """
+    left, bottom, w, h, rot = geometry
+    src_w, src_h = (h, w) if rot in (90, 270) else (w, h)
+    scale, x_offset, y_offset = fit_in_slot(src_w, src_h, slot, zoom, align)
+
+    # The content ignores the source /Rotate: turn it clockwise by rot and
+    # shift it back to the origin so it lands upright.
+    t = Transformation().translate(-left, -bottom)
     if rot:
-        t = t.rotate(-rot)
+        shift = {90: (0, w), 180: (w, h), 270: (h, 0)}[rot]
+        t = t.rotate(-rot).translate(*shift)
     t = t.scale(scale)
-    t = t.translate(x_offset, y_offset)
+    return t.translate(x_offset, y_offset)
+
+
+def slot_transform(src_page, slot, zoom: float, align: str = "center") -> Transformation:
+    """
+    Transformation mapping src_page's content (in its own user space) into
+    slot, upright and scaled uniformly to fit (see fit_in_slot for zoom
+    and align).
+    """
+    return geometry_transform(page_geometry(src_page), tuple(slot), zoom, align)
+
 
-    new_page.merge_transformed_page(src_page, t)
+@functools.lru_cache(maxsize=256)
+def cm_operands(ctm: Tuple[float, ...]) -> str:
+    # PDF numbers have no exponent notation
+    return " ".join("{:.5f}".format(v).rstrip("0").rstrip(".") for v in ctm)
+
+
+def add_indirect(writer: PdfWriter, obj):
+    """
+    Add obj to writer as an indirect object and return its reference.
+
+    Streams must be indirect, and pypdf has no public call for that. This
+    is the single place that uses the private PdfWriter._add_object. It
+    exists in pypdf 3.0 through 6.x (tested with 6.20) and fails with a
+    clear error if a later version removes it.
+    """
+    add_object = getattr(writer, "_add_object", None)
+    if add_object is None:
+        raise RuntimeError("this pypdf version has no PdfWriter._add_object; "
+                           "use pypdf 3.0-6.x or --engine mupdf")
+    return add_object(obj)
+
+
+class FormXObjectCache:
+    """
+    One form XObject per source page, shared by every slot that shows it.
+
+    Duplicating a source (2-up/4-up default mode) then references the same
+    object from each slot instead of copying its content stream, so output
+    size and build time follow the number of unique pages.
+    """
+
+    def __init__(self, writer: PdfWriter):
+        self.writer = writer
+        self._forms = {}  # (id(reader), page index) -> IndirectObject
+
+    def get(self, reader: PdfReader, index: int):
+        key = (id(reader), index)
+        ref = self._forms.get(key)
+        if ref is None:
+            ref = self._forms[key] = self._make_form(reader.pages[index])
+        return ref
+
+    def _make_form(self, src_page):
+        contents = src_page.get_contents()
+        form = DecodedStreamObject()
+        form.set_data(contents.get_data() if contents is not None else b"")
+        form = form.flate_encode()
+        resources = src_page.get("/Resources")
+        form.update({
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Form"),
+            NameObject("/BBox"): ArrayObject(FloatObject(v) for v in src_page.mediabox),
+            NameObject("/Resources"): (resources.get_object().clone(self.writer)
+                                       if resources is not None else DictionaryObject()),
+        })
+        return add_indirect(self.writer, form)
+
+
+def draw_forms(sheet: PageObject, writer: PdfWriter, placements: list) -> None:
+    """Set sheet's content to `q <cm> /FxN Do Q` for each (form, Transformation)."""
+    xobjects = DictionaryObject()
+    ops = []
+    for n, (form_ref, t) in enumerate(placements):
+        name = "/Fx{}".format(n)
+        xobjects[NameObject(name)] = form_ref
+        ops.append("q {} cm {} Do Q".format(cm_operands(t.ctm), name))
+    sheet[NameObject("/Resources")] = DictionaryObject({NameObject("/XObject"): xobjects})
+    content = DecodedStreamObject()
+    content.set_data("\n".join(ops).encode("ascii"))
+    sheet[NameObject("/Contents")] = add_indirect(writer, content)
+
+
+def show_page_mupdf(sheet, src_doc, page_index: int, sheet_h: float, slot, zoom: float, align: str = "center"):
+    """
+    MuPDF counterpart of slot_transform: show page_index of src_doc on
+    sheet with the same geometry (MediaBox, rotation, zoom and align).
+    MuPDF itself keeps one XObject per source page across the output.
+    """
+    src_page = src_doc[page_index]
+    mb = src_page.mediabox
+    rot = src_page.rotation
+    src_w, src_h = (mb.height, mb.width) if rot in (90, 270) else (mb.width, mb.height)
+    scale, x_offset, y_offset = fit_in_slot(src_w, src_h, slot, zoom, align)
+
+    # fitz rectangles have their origin at the top-left of the sheet
+    top = sheet_h - (y_offset + src_h * scale)
+    rect = fitz.Rect(x_offset, top, x_offset + src_w * scale, top + src_h * scale)
+    # show_pdf_page mixes the rotated page rect with the unrotated content:
+    # show the page unrotated and apply /Rotate through its own parameter.
+    # It also shows only the CropBox, stretched over rect: widen the CropBox
+    # to the MediaBox for the call, as the pypdf engine draws the MediaBox.
+    # The raw /CropBox is swapped because set_cropbox() measures from the
+    # MediaBox top and rejects boxes that don't fit the page. A page
+    # without its own /CropBox may inherit one, so it gets one too ("null"
+    # removes it again afterwards).
+    crop_type, crop_value = src_doc.xref_get_key(src_page.xref, "CropBox")
+    if rot:
+        src_page.set_rotation(0)
+    src_doc.xref_set_key(src_page.xref, "CropBox", "[{:g} {:g} {:g} {:g}]".format(*mb))
+    try:
+        sheet.show_pdf_page(rect, src_doc, page_index, rotate=-rot)
+    finally:
+        src_doc.xref_set_key(src_page.xref, "CropBox", crop_value if crop_type != "null" else "null")
+        if rot:
+            src_page.set_rotation(rot)
 
 
 # ---------------------------------------------------------------------------
 # Layout builders
 # ---------------------------------------------------------------------------
 
-def build_writer_2up(
-    sources: List[PdfReader],
-    out_path: str,
-    sheet_size: str,
-    align: str,
-    stop_mode: str,
-    margin_in: float,
-    gutter_in: float,
-    zoom: float,
-):
+def open_sources(paths: List[str], engine: str = "pypdf") -> list:
+    """Open each input once (duplicated inputs share one document)."""
+    if engine == "mupdf" and fitz is None:
+        raise RuntimeError("--engine mupdf needs PyMuPDF (pip install pymupdf)")
+    opened = {}
+    sources = []
+    for path in paths:
+        key = os.path.abspath(path)
+        if key not in opened:
+            opened[key] = fitz.open(path) if engine == "mupdf" else PdfReader(path)
+        sources.append(opened[key])
+    return sources
+
+
+def source_page_count(source) -> int:
+    """Page count of a PdfReader or a fitz.Document."""
+    if isinstance(source, PdfReader):
+        return len(source.pages)
+    return source.page_count
+
+
+def sheet_count(sources: list, stop_mode: str) -> int:
+    counts = [source_page_count(s) for s in sources]
+    if stop_mode == "shortest":
+        return min(counts)
+    return max(counts)
+
+
+class SheetPlan(NamedTuple):
+    """What one output page shows, computed before any PDF work."""
+    cells: Tuple[Optional[Tuple[int, int]], ...]  # per slot: (source index, page index) or None
+    rotate: int = 0  # /Rotate of the output page (booklet back sides)
+
+
+def select_pages(total: int, pages_spec: str = "") -> List[int]:
+    """Source page indices (0-based) kept by pages_spec ("40-80", page_ranges syntax)."""
+    if not pages_spec:
+        return list(range(total))
+    return [p - 1 for p in parse_page_ranges(pages_spec, total)]
+
+
+def nup_plan(pages: List[int], n_slots: int, n_sources: int) -> List[SheetPlan]:
+    """2-up/4-up: sheet i shows page i in every slot, slot k from source k (or the last one)."""
+    return [SheetPlan(tuple((min(k, n_sources - 1), i) for k in range(n_slots))) for i in pages]
+
+
+def booklet_plan(pages: List[int], back_rotate: int = 0) -> List[SheetPlan]:
     """
-    2-up layout: two columns on a landscape sheet (letter or A4).
-    sources should contain 1 or 2 PdfReaders.
+    Saddle-stitch order for a 2-slot sheet, front and back of every sheet.
+
+    The pages are padded with blanks to a multiple of 4. With m padded
+    pages, sheet s shows (m-1-2s | 2s) on the front and (2s+1 | m-2-2s) on
+    the back, so the folded stack reads in order. back_rotate (0 or 180)
+    turns the back sides for printers that do not flip them.
+    """
+    m = -(-len(pages) // 4) * 4
+    padded = list(pages) + [None] * (m - len(pages))
+
+    def cell(n):
+        return None if padded[n] is None else (0, padded[n])
+
+    plan = []
+    for s in range(m // 4):
+        plan.append(SheetPlan((cell(m - 1 - 2 * s), cell(2 * s))))
+        plan.append(SheetPlan((cell(2 * s + 1), cell(m - 2 - 2 * s)), back_rotate))
+    return plan
+
+
+def plan_sheets(mode: str, n_slots: int, n_sources: int, total: int,
+                pages_spec: str = "", sheets_spec: str = "", back_rotate: int = 0) -> List[SheetPlan]:
+    """
+    The full imposition plan: --pages picks the source pages, the mode
+    orders them on sheets, --sheets then keeps only those output pages.
+    Raises ValueError for malformed or out-of-range selections.
+    """
+    pages = select_pages(total, pages_spec)
+    if mode == "booklet":
+        plan = booklet_plan(pages, back_rotate)
+    else:
+        plan = nup_plan(pages, n_slots, n_sources)
+    if sheets_spec:
+        plan = [plan[s - 1] for s in parse_page_ranges(sheets_spec, len(plan))]
+    return plan
+
+
+def layout_2up(sheet_size: str, margin_in: float, gutter_in: float):
+    """
+    Return (W, H, slots) for a 2-up sheet: two columns on a landscape sheet.
+    Slots are (x, y, w, h) in PDF points, left then right.
     """
     if sheet_size not in SHEET_SIZES:
         raise ValueError("Unknown sheet size: {}".format(sheet_size))
@@ -272,45 +539,13 @@ def build_writer_2up(
         (margin, margin, slot_w, slot_h),                    # left
         (margin + slot_w + gutter, margin, slot_w, slot_h),  # right
     ]
+    return W, H, slots
 
-    writer = PdfWriter()
-    counts = [len(r.pages) for r in sources]
-    if stop_mode == "shortest":
-        total = min(counts)
-    else:
-        total = max(counts)
 
-    for i in range(total):
-        new_page = PageObject.create_blank_page(width=W, height=H)
-        for slot_idx, (x, y, sw, sh) in enumerate(slots):
-            reader = sources[min(slot_idx, len(sources) - 1)]
-            if i < len(reader.pages):
-                src_page = reader.pages[i]
-                place_page(new_page, src_page, x, y, sw, sh, zoom=zoom, align=align)
-            else:
-                # This source has no page i: leave this slot blank.
-                pass
-        writer.add_page(new_page)
-
-    with open(out_path, "wb") as f:
-        writer.write(f)
-
-
-def build_writer_4up(
-    sources: List[PdfReader],
-    out_path: str,
-    sheet_size: str,
-    orientation: str,
-    align: str,
-    stop_mode: str,
-    margin_in: float,
-    gutter_x_in: float,
-    gutter_y_in: float,
-    zoom: float,
-):
+def layout_4up(sheet_size: str, orientation: str, margin_in: float, gutter_x_in: float, gutter_y_in: float):
     """
-    4-up layout: 2x2 grid. By default, sheet is portrait:
-    letter (8.5 x 11) or A4.
+    Return (W, H, slots) for a 4-up sheet: 2x2 grid, portrait by default.
+    Slots are (x, y, w, h) in PDF points, in reading order.
     """
     if sheet_size not in SHEET_SIZES:
         raise ValueError("Unknown sheet size: {}".format(sheet_size))
@@ -337,34 +572,454 @@ def build_writer_4up(
         (margin,                     margin,                     slot_w, slot_h),  # BL
         (margin + slot_w + gutter_x, margin,                     slot_w, slot_h),  # BR
     ]
+    return W, H, slots
 
-    writer = PdfWriter()
-    counts = [len(r.pages) for r in sources]
-    if stop_mode == "shortest":
-        total = min(counts)
-    else:
-        total = max(counts)
 
-    for i in range(total):
-        new_page = PageObject.create_blank_page(width=W, height=H)
-        for slot_idx, (x, y, sw, sh) in enumerate(slots):
-            reader = sources[min(slot_idx, len(sources) - 1)]
+def impose_pypdf(sources: List[PdfReader], W: float, H: float, slots: list,
+                 sheets: Sequence[SheetPlan], align: str, zoom: float, on_sheet=None) -> PdfWriter:
+    """
+    Build one sheet per SheetPlan with pypdf. Pages that no plan names
+    are never read.
+    """
+    writer = PdfWriter()
+    forms = FormXObjectCache(writer)
+    for plan in sheets:
+        placements = []
+        for slot, cell in zip(slots, plan.cells):
+            if cell is None:
+                continue
+            reader = sources[cell[0]]
+            i = cell[1]
             if i < len(reader.pages):
                 src_page = reader.pages[i]
-                place_page(new_page, src_page, x, y, sw, sh, zoom=zoom, align=align)
+                placements.append((forms.get(reader, i), slot_transform(src_page, slot, zoom, align)))
             else:
-                # No page i for this source -> blank slot.
+                # This source has no page i: leave this slot blank.
                 pass
-        writer.add_page(new_page)
+        sheet = writer.add_page(PageObject.create_blank_page(width=W, height=H))
+        draw_forms(sheet, writer, placements)
+        if plan.rotate:
+            sheet.rotate(plan.rotate)
+        if on_sheet:
+            on_sheet()
+    return writer
+
+
+def impose_mupdf(sources: list, W: float, H: float, slots: list,
+                 sheets: Sequence[SheetPlan], align: str, zoom: float, on_sheet=None):
+    """Same as impose_pypdf, with PyMuPDF's show_pdf_page (no rasterization)."""
+    out = fitz.open()
+    for plan in sheets:
+        sheet = out.new_page(width=W, height=H)
+        for slot, cell in zip(slots, plan.cells):
+            if cell is None:
+                continue
+            doc = sources[cell[0]]
+            if cell[1] < doc.page_count:
+                show_page_mupdf(sheet, doc, cell[1], H, slot, zoom=zoom, align=align)
+        if plan.rotate:
+            sheet.set_rotation(plan.rotate)
+        if on_sheet:
+            on_sheet()
+    return out
+
+
+def impose_sheets(engine: str, sources: list, W: float, H: float, slots: list,
+                  sheets: Sequence[SheetPlan], align: str, zoom: float, on_sheet=None):
+    """Build the given sheets with the chosen engine; on_sheet() is called per sheet."""
+    if engine == "mupdf":
+        return impose_mupdf(sources, W, H, slots, sheets, align, zoom, on_sheet)
+    return impose_pypdf(sources, W, H, slots, sheets, align, zoom, on_sheet)
+
+
+def write_output(out, out_path: str) -> None:
+    """Save a PdfWriter or a fitz.Document built by impose_sheets."""
+    if isinstance(out, PdfWriter):
+        with open(out_path, "wb") as f:
+            out.write(f)
+    else:
+        out.save(out_path, garbage=1, deflate=True)
+        out.close()
+
+
+def close_sources(sources: list) -> None:
+    """Close PyMuPDF documents (PdfReaders hold no file handle)."""
+    for source in {id(s): s for s in sources}.values():
+        if not isinstance(source, PdfReader):
+            source.close()
+
+
+def release_source_caches(sources: list) -> None:
+    """Drop the objects parsed for the previous part (streaming mode)."""
+    for source in sources:
+        if isinstance(source, PdfReader):
+            # decoded content streams and resources are cached per object
+            source.resolved_objects.clear()
+    if fitz is not None:
+        fitz.TOOLS.store_shrink(100)
+
+
+def windows_peak_mb():
+    """Peak working set of this process in MB (GetProcessMemoryInfo), or None."""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+            (name, ctypes.c_size_t) for name in (
+                "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")
+        ]
+
+    try:
+        kernel32 = ctypes.WinDLL("kernel32")
+        psapi = ctypes.WinDLL("psapi")
+    except (AttributeError, OSError):
+        return None
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    psapi.GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+    psapi.GetProcessMemoryInfo.restype = wintypes.BOOL
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    if not psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+        return None
+    return counters.PeakWorkingSetSize / (1024 * 1024)
+
+
+def peak_rss_mb():
+    """
+    Peak resident memory of this process in MB, or None if unknown:
+    VmHWM on Linux, the peak working set on Windows, ru_maxrss elsewhere.
+    """
+    if sys.platform == "win32":
+        return windows_peak_mb()
+    # Linux: VmHWM starts over at exec, unlike ru_maxrss which a child
+    # inherits from its parent (e.g. the GUI that started the tool)
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
 
+
+def format_size(n_bytes: int) -> str:
+    if n_bytes >= 1024 * 1024:
+        return "{:.1f} MB".format(n_bytes / (1024 * 1024))
+    return "{:.0f} KB".format(n_bytes / 1024)
+
+
+def optimize_pdf(path: str) -> Tuple[int, int]:
+    """
+    Rewrite path smaller, in place: identical objects and streams merged
+    (compared by hash), every stream deflated and, with PyMuPDF, objects
+    packed into object streams. The pypdf fallback has no object streams.
+    Returns (bytes before, bytes after); path is only replaced if smaller.
+    """
+    before = os.path.getsize(path)
+    tmp_path = path + ".opt.tmp"
+    try:
+        if fitz is not None:
+            with fitz.open(path) as doc:
+                doc.save(tmp_path, garbage=4, deflate=True, deflate_images=True, deflate_fonts=True,
+                         use_objstms=1)
+        else:
+            writer = PdfWriter(clone_from=path)
+            writer.compress_identical_objects()
+            for page in writer.pages:
+                page.compress_content_streams()
+            with open(tmp_path, "wb") as f:
+                writer.write(f)
+        after = os.path.getsize(tmp_path)
+        if after < before:
+            os.replace(tmp_path, path)
+        else:
+            after = before
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return before, after
+
+
+def merge_parts(parts: List[str], out_path: str) -> None:
+    """
+    Concatenate part files into out_path, in list order.
+
+    With PyMuPDF every part is appended with an incremental save, so only
+    one part is held in memory at a time. The pypdf fallback appends all
+    parts into one writer (memory then grows with the output again).
+    """
+    if not parts:
+        raise RuntimeError("nothing to merge: no part files were written")
+    if fitz is not None:
+        shutil.copyfile(parts[0], out_path)
+        for part in parts[1:]:
+            with fitz.open(out_path) as out, fitz.open(part) as src:
+                out.insert_pdf(src)
+                out.saveIncr()
+        return
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(part)
     with open(out_path, "wb") as f:
         writer.write(f)
 
 
+def part_file(part_dir: str, start: int) -> str:
+    return os.path.join(part_dir, "part_{:06d}.pdf".format(start))
+
+
+def impose_chunked(engine: str, sources: list, out_path: str, W: float, H: float, slots: list,
+                   plan: List[SheetPlan], align: str, zoom: float, chunk_sheets: int) -> None:
+    """
+    Write the sheets as parts of chunk_sheets sheets, then merge them.
+    Only one part is built in memory at a time.
+    """
+    part_dir = tempfile.mkdtemp(prefix="2up_parts_", dir=os.path.dirname(os.path.abspath(out_path)))
+    tracker = tool_progress.Tracker(len(plan), "sheets")
+    try:
+        parts = []
+        t0 = time.perf_counter()
+        for start in range(0, len(plan), chunk_sheets):
+            part_path = part_file(part_dir, start)
+            out = impose_sheets(engine, sources, W, H, slots, plan[start:start + chunk_sheets],
+                                align, zoom, tracker.step)
+            write_output(out, part_path)
+            parts.append(part_path)
+            release_source_caches(sources)
+        tool_progress.timing("impose", time.perf_counter() - t0)
+
+        with tool_progress.timed("merge"):
+            merge_parts(parts, out_path)
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+
+
+# Sources opened once per worker process by init_worker (--jobs).
+_worker_sources = None
+
+
+def init_worker(engine: str, inputs: List[str]) -> None:
+    global _worker_sources
+    _worker_sources = open_sources(inputs, engine)
+
+
+def impose_part(engine: str, part_path: str, W: float, H: float, slots: list,
+                sheets: List[SheetPlan], align: str, zoom: float) -> Tuple[str, float]:
+    """Worker side of impose_parallel: write the given sheets to part_path."""
+    out = impose_sheets(engine, _worker_sources, W, H, slots, sheets, align, zoom)
+    write_output(out, part_path)
+    release_source_caches(_worker_sources)
+    return part_path, peak_rss_mb() or 0.0
+
+
+def impose_parallel(engine: str, inputs: List[str], out_path: str, W: float, H: float, slots: list,
+                    plan: List[SheetPlan], align: str, zoom: float, jobs: int, chunk_sheets: int = 0) -> float:
+    """
+    Impose the sheets in `jobs` worker processes, one part file per chunk,
+    then merge the parts in sheet order. Every sheet only depends on page i
+    of each source, so the chunks are independent.
+
+    Each part shares its forms, fonts and images between its own sheets;
+    only resources used across the whole manual are repeated once per part.
+    Without chunk_sheets the range is therefore cut into few chunks (two per
+    worker, for load balancing and progress). Returns the peak memory of the
+    largest worker in MB.
+    """
+    if not chunk_sheets:
+        chunk_sheets = max(1, -(-len(plan) // (jobs * PARALLEL_CHUNKS_PER_JOB)))
+    starts = list(range(0, len(plan), chunk_sheets))
+    jobs = min(jobs, len(starts))
+
+    part_dir = tempfile.mkdtemp(prefix="2up_parts_", dir=os.path.dirname(os.path.abspath(out_path)))
+    tracker = tool_progress.Tracker(len(plan), "sheets")
+    worker_peak = 0.0
+    try:
+        t0 = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                                 initargs=(engine, inputs)) as pool:
+            futures = {}
+            for start in starts:
+                sheets = plan[start:start + chunk_sheets]
+                future = pool.submit(impose_part, engine, part_file(part_dir, start),
+                                     W, H, slots, sheets, align, zoom)
+                futures[future] = len(sheets)
+            for future in as_completed(futures):
+                _part_path, peak = future.result()
+                worker_peak = max(worker_peak, peak)
+                tracker.step(futures[future])
+        tool_progress.timing("impose", time.perf_counter() - t0)
+
+        with tool_progress.timed("merge"):
+            merge_parts([part_file(part_dir, start) for start in starts], out_path)
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+    return worker_peak
+
+
+def impose(engine: str, inputs: List[str], out_path: str, W: float, H: float, slots: list,
+           stop_mode: str, align: str, zoom: float, chunk_sheets: int = 0, jobs: int = 1,
+           pages_spec: str = "", sheets_spec: str = "", mode: str = "nup", back_rotate: int = 0,
+           optimize: bool = False):
+    with tool_progress.timed("load"):
+        sources = open_sources(inputs, engine)
+    worker_peak = None
+    parallel = False
+    # the sources are closed on every path, errors included: open PyMuPDF
+    # documents keep their files locked on Windows
+    try:
+        plan = plan_sheets(mode, len(slots), len(sources), sheet_count(sources, stop_mode),
+                           pages_spec, sheets_spec, back_rotate)
+        if jobs > 1 and len(plan) > 1:
+            # the workers open their own copies
+            parallel = True
+            close_sources(sources)
+            worker_peak = impose_parallel(engine, inputs, out_path, W, H, slots, plan, align, zoom,
+                                          jobs, chunk_sheets)
+        elif chunk_sheets and len(plan) > chunk_sheets:
+            impose_chunked(engine, sources, out_path, W, H, slots, plan, align, zoom, chunk_sheets)
+        else:
+            tracker = tool_progress.Tracker(len(plan), "sheets")
+            t0 = time.perf_counter()
+            out = impose_sheets(engine, sources, W, H, slots, plan, align, zoom, tracker.step)
+            tool_progress.timing("impose", time.perf_counter() - t0)
+            with tool_progress.timed("write"):
+                write_output(out, out_path)
+    finally:
+        if not parallel:
+            close_sources(sources)
+
+    if optimize:
+        t0 = time.perf_counter()
+        before, after = optimize_pdf(out_path)
+        seconds = time.perf_counter() - t0
+        tool_progress.timing("optimize", seconds)
+        print("Optimized: {} -> {} ({} saved, {:.0f}%) in {:.1f} s".format(
+            format_size(before), format_size(after), format_size(before - after),
+            100.0 * (before - after) / before if before else 0.0, seconds))
+
+    peak = peak_rss_mb()
+    if peak is None:
+        print("Peak memory: n/a")
+    elif worker_peak:
+        print("Peak memory: {:.0f} MB (largest worker: {:.0f} MB)".format(peak, worker_peak))
+    else:
+        print("Peak memory: {:.0f} MB".format(peak))
+
+
+def build_writer_2up(
+    inputs: List[str],
+    out_path: str,
+    sheet_size: str,
+    align: str,
+    stop_mode: str,
+    margin_in: float,
+    gutter_in: float,
+    zoom: float,
+    engine: str = "pypdf",
+    chunk_sheets: int = 0,
+    jobs: int = 1,
+    pages_spec: str = "",
+    sheets_spec: str = "",
+    optimize: bool = False,
+):
+    """
+    2-up layout: two columns on a landscape sheet (letter or A4).
+    inputs should contain 1 or 2 PDF paths.
+    """
+    W, H, slots = layout_2up(sheet_size, margin_in, gutter_in)
+    impose(engine, inputs, out_path, W, H, slots, stop_mode, align, zoom, chunk_sheets, jobs,
+           pages_spec, sheets_spec, optimize=optimize)
+
+
+def build_writer_booklet(
+    inputs: List[str],
+    out_path: str,
+    sheet_size: str,
+    align: str,
+    margin_in: float,
+    gutter_in: float,
+    zoom: float,
+    back_rotate: int = 0,
+    engine: str = "pypdf",
+    chunk_sheets: int = 0,
+    jobs: int = 1,
+    pages_spec: str = "",
+    sheets_spec: str = "",
+    optimize: bool = False,
+):
+    """
+    Saddle-stitch booklet: the 2-up sheet of build_writer_2up, with the
+    pages of inputs[0] in booklet order (see booklet_plan). Print duplex
+    and fold: letter sheets give a half-letter booklet.
+    """
+    W, H, slots = layout_2up(sheet_size, margin_in, gutter_in)
+    impose(engine, inputs[:1], out_path, W, H, slots, "longest", align, zoom, chunk_sheets, jobs,
+           pages_spec, sheets_spec, mode="booklet", back_rotate=back_rotate, optimize=optimize)
+
+
+def build_writer_4up(
+    inputs: List[str],
+    out_path: str,
+    sheet_size: str,
+    orientation: str,
+    align: str,
+    stop_mode: str,
+    margin_in: float,
+    gutter_x_in: float,
+    gutter_y_in: float,
+    zoom: float,
+    engine: str = "pypdf",
+    chunk_sheets: int = 0,
+    jobs: int = 1,
+    pages_spec: str = "",
+    sheets_spec: str = "",
+    optimize: bool = False,
+):
+    """
+    4-up layout: 2x2 grid. By default, sheet is portrait:
+    letter (8.5 x 11) or A4.
+    """
+    W, H, slots = layout_4up(sheet_size, orientation, margin_in, gutter_x_in, gutter_y_in)
+    impose(engine, inputs, out_path, W, H, slots, stop_mode, align, zoom, chunk_sheets, jobs,
+           pages_spec, sheets_spec, optimize=optimize)
+
+
 # ---------------------------------------------------------------------------
 # Input / argument handling
 # ---------------------------------------------------------------------------
 
+def non_negative_int(text: str) -> int:
+    """argparse type for counts where 0 means off."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid int value: '{}'".format(text)) from None
+    if value < 0:
+        raise argparse.ArgumentTypeError("must be 0 or more, got {}".format(value))
+    return value
+
+
+def positive_int(text: str) -> int:
+    """argparse type for counts of at least 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid int value: '{}'".format(text)) from None
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be 1 or more, got {}".format(value))
+    return value
+
+
 def auto_output_name(mode: str, inputs: List[str]) -> str:
     if not inputs:
         return "output_{}.pdf".format(mode)
@@ -384,7 +1039,9 @@ def resolve_inputs(args) -> List[str]:
     If no inputs are provided, files are selected interactively
     from the current directory.
     """
-    if args.mode == "2up":
+    if args.mode == "booklet":
+        needed = 1
+    elif args.mode == "2up":
         needed = 2
     else:
         needed = 4
@@ -398,6 +1055,198 @@ def resolve_inputs(args) -> List[str]:
     return interactive_pick(needed)
 
 
+def build_layout(args, inputs: List[str], out_path: str, jobs: int = 1) -> None:
+    """Run build_writer_2up / build_writer_4up with the layout options in args."""
+    if args.mode == "2up":
+        build_writer_2up(
+            inputs,
+            out_path,
+            sheet_size=args.sheet,
+            align=args.align,
+            stop_mode=args.stop,
+            margin_in=args.margin_in,
+            gutter_in=args.gutter_in,
+            zoom=args.zoom,
+            engine=args.engine,
+            chunk_sheets=args.chunk_sheets,
+            jobs=jobs,
+            pages_spec=args.pages,
+            sheets_spec=args.sheets,
+            optimize=args.optimize,
+        )
+    elif args.mode == "booklet":
+        build_writer_booklet(
+            inputs,
+            out_path,
+            sheet_size=args.sheet,
+            align=args.align,
+            margin_in=args.margin_in,
+            gutter_in=args.gutter_in,
+            zoom=args.zoom,
+            back_rotate=args.back_rotate,
+            engine=args.engine,
+            chunk_sheets=args.chunk_sheets,
+            jobs=jobs,
+            pages_spec=args.pages,
+            sheets_spec=args.sheets,
+            optimize=args.optimize,
+        )
+    else:
+        build_writer_4up(
+            inputs,
+            out_path,
+            sheet_size=args.sheet,
+            orientation=args.orientation,
+            align=args.align,
+            stop_mode=args.stop,
+            margin_in=args.margin_in,
+            gutter_x_in=args.gutter_in,
+            gutter_y_in=args.gutter_y_in,
+            zoom=args.zoom,
+            engine=args.engine,
+            chunk_sheets=args.chunk_sheets,
+            jobs=jobs,
+            pages_spec=args.pages,
+            sheets_spec=args.sheets,
+            optimize=args.optimize,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Batch mode
+# ---------------------------------------------------------------------------
+
+def read_titles(list_path: str) -> List[str]:
+    """One title, folder or PDF per line; blank lines and # comments are ignored."""
+    with open(list_path, encoding="utf-8") as f:
+        lines = [line.strip() for line in f]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def resolve_batch_inputs(items: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Return (pdf paths, problems) for a mix of folders, PDF files and titles.
+
+    Folders contribute every PDF directly inside them. Titles are searched
+    in PDF_FOLDERS like the interactive mode, but nothing is asked: a title
+    with several matches is only used if exactly one file is named after
+    it, otherwise it is reported as a problem.
+    """
+    paths = []
+    problems = []
+    for item in items:
+        if os.path.isdir(item):
+            found = sorted((os.path.join(item, f) for f in os.listdir(item) if f.lower().endswith(".pdf")),
+                           key=lambda x: x.lower())
+            if not found:
+                problems.append("{}: no PDF in folder".format(item))
+            paths.extend(found)
+        elif os.path.isfile(item):
+            paths.append(item)
+        else:
+            matches = find_pdfs(item)
+            if len(matches) > 1:
+                named = [m for m in matches if os.path.splitext(os.path.basename(m))[0].lower() == item.lower()]
+                if len(named) == 1:
+                    matches = named
+            if not matches:
+                problems.append("{}: no PDF found".format(item))
+            elif len(matches) > 1:
+                problems.append("{}: {} matches, be more specific".format(item, len(matches)))
+            else:
+                paths.append(matches[0])
+
+    unique = {}
+    for path in paths:
+        unique.setdefault(os.path.abspath(path), path)
+    return list(unique.values()), problems
+
+
+def is_up_to_date(src: str, out_path: str) -> bool:
+    return os.path.isfile(out_path) and os.path.getmtime(out_path) >= os.path.getmtime(src)
+
+
+def init_batch_worker() -> None:
+    # The parent reports progress per file; workers stay quiet.
+    tool_progress.disable()
+
+
+def impose_file(args, src: str, out_path: str) -> Tuple[float, str]:
+    """Batch worker: impose one source, return (seconds, error or "")."""
+    t0 = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_layout(args, [src], out_path)
+    except Exception as e:
+        # never leave a partial output that would look up to date next time
+        if os.path.isfile(out_path):
+            os.remove(out_path)
+        return time.perf_counter() - t0, str(e) or type(e).__name__
+    return time.perf_counter() - t0, ""
+
+
+def run_batch(args) -> int:
+    """
+    Impose every source of the batch (duplicated, default layout) into
+    args.out_dir, args.jobs files at a time. Outputs newer than their
+    source are skipped unless args.force. Returns 1 if any file failed.
+    """
+    items = list(args.inputs)
+    if args.titles:
+        items += read_titles(args.titles)
+    sources, problems = resolve_batch_inputs(items)
+    for problem in problems:
+        print("Skipped:", problem)
+    if not sources:
+        print("Nothing to impose.")
+        return 1 if problems else 0
+
+    out_dir = args.out_dir or "."
+    os.makedirs(out_dir, exist_ok=True)
+    results = {}  # src -> (out_path, status, seconds, detail)
+    todo = []
+    for src in sources:
+        out_path = os.path.join(out_dir, auto_output_name(args.mode, [src]))
+        if not args.force and is_up_to_date(src, out_path):
+            results[src] = (out_path, "skipped", None, "up to date")
+        else:
+            todo.append((src, out_path))
+
+    jobs = args.jobs or os.cpu_count() or 1
+    print("Batch: {} file(s) to impose, {} up to date, {} worker(s).".format(
+        len(todo), len(sources) - len(todo), min(jobs, len(todo)) if todo else 0))
+
+    t0 = time.perf_counter()
+    if todo:
+        tracker = tool_progress.Tracker(len(todo), "files")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo)), initializer=init_batch_worker) as pool:
+            futures = {pool.submit(impose_file, args, src, out_path): (src, out_path) for src, out_path in todo}
+            for future in as_completed(futures):
+                src, out_path = futures[future]
+                seconds, error = future.result()
+                if error:
+                    results[src] = (out_path, "failed", seconds, error)
+                else:
+                    results[src] = (out_path, "done", seconds, "")
+                    tool_progress.artifact(out_path, "pdf")
+                print("{} {} ({:.1f} s)".format("Failed:" if error else "Wrote:", out_path, seconds))
+                tracker.step()
+    total_time = time.perf_counter() - t0
+
+    print("\nBatch summary ({}):".format(args.mode))
+    name_w = max(len(os.path.basename(results[src][0])) for src in sources)
+    for src in sources:
+        out_path, status, seconds, detail = results[src]
+        size = format_size(os.path.getsize(out_path)) if status != "failed" else "-"
+        took = "{:.1f} s".format(seconds) if seconds is not None else "-"
+        line = "  {:<{w}}  {:<8} {:>8} {:>9}".format(os.path.basename(out_path), status, took, size, w=name_w)
+        print(line + ("  " + detail if detail else ""))
+    counts = {status: sum(1 for r in results.values() if r[1] == status) for status in ("done", "skipped", "failed")}
+    print("{} done, {} skipped, {} failed, {} unusable input(s) in {:.1f} s".format(
+        counts["done"], counts["skipped"], counts["failed"], len(problems), total_time))
+    return 1 if counts["failed"] or problems else 0
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -417,9 +1266,12 @@ def main():
     )
     parser.add_argument(
         "-m", "--mode",
-        choices=["2up", "4up"],
+        choices=["2up", "4up", "booklet"],
         default="2up",
-        help="Layout mode: 2up (side-by-side) or 4up (2x2 grid). Default 2up.",
+        help=(
+            "Layout mode: 2up (side-by-side), 4up (2x2 grid) or booklet "
+            "(2-up sheets in saddle-stitch order, one source). Default 2up."
+        ),
     )
     parser.add_argument(
         "-o", "--output",
@@ -480,6 +1332,90 @@ def main():
             "Values > 1.0 are clamped so content never exceeds the slot. Default 1.0."
         ),
     )
+    parser.add_argument(
+        "--back-rotate",
+        type=int,
+        choices=[0, 180],
+        default=0,
+        help="For booklet only: rotate the back sides by 180 degrees, for duplex printers "
+             "that do not flip them. Default 0.",
+    )
+    parser.add_argument(
+        "--pages",
+        default="",
+        metavar="RANGES",
+        help=(
+            "Only impose these source pages, e.g. 40-80 or 1-5,8,12- "
+            "(same syntax as print_settings.json). Default: all pages."
+        ),
+    )
+    parser.add_argument(
+        "--sheets",
+        default="",
+        metavar="RANGES",
+        help=(
+            "Only write these output sheets (1-based, same syntax as --pages; for booklet, "
+            "sheet sides: 1 = front of the outer sheet). Default: all sheets."
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="pypdf",
+        help="Imposition backend: pypdf (default) or mupdf (PyMuPDF show_pdf_page, much faster).",
+    )
+    parser.add_argument(
+        "--chunk-sheets",
+        type=non_negative_int,
+        default=0,
+        metavar="N",
+        help=(
+            "Streaming mode for very large manuals: write the output in parts of N sheets "
+            "and merge them at the end, so memory stays flat. 0 = off (default)."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=None,
+        metavar="N",
+        help=(
+            "Impose in N worker processes (chunks of sheets, merged in order at the end). "
+            "Default 1. Combine with --chunk-sheets to set the chunk size. "
+            "With --batch: number of files imposed at the same time (default: CPU count)."
+        ),
+    )
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help=(
+            "Post-write pass: merge duplicate fonts/images/streams, compress all streams and "
+            "pack objects into object streams (smaller files to spool). Reports bytes saved."
+        ),
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Non-interactive batch mode: inputs are folders, PDF files or titles searched "
+            "in PDF_FOLDERS; each one is imposed on its own (duplicated layout)."
+        ),
+    )
+    parser.add_argument(
+        "--titles",
+        metavar="FILE",
+        help="With --batch: text file with one title, folder or PDF per line.",
+    )
+    parser.add_argument(
+        "--out-dir",
+        metavar="DIR",
+        help="With --batch: folder for the outputs. Default: current folder.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --batch: rebuild outputs that are already newer than their source.",
+    )
     parser.add_argument(
         "--manual-inputs",
         action="store_true",
@@ -491,6 +1427,9 @@ def main():
 
     args = parser.parse_args()
 
+    if args.batch:
+        return run_batch(args)
+
     print(
         "Hint: by default, this program searches PDF_FOLDERS for a single PDF by name "
         "and duplicates it (2-up or 4-up).\n"
@@ -509,7 +1448,9 @@ def main():
         return
 
     # Truncate to maximum allowed per mode
-    if args.mode == "2up":
+    if args.mode == "booklet":
+        inputs = inputs[:1]
+    elif args.mode == "2up":
         inputs = inputs[:2]
     else:
         inputs = inputs[:4]
@@ -522,37 +1463,16 @@ def main():
 
     out_path = args.output or auto_output_name(args.mode, inputs)
 
-    # Load readers
-    readers = [PdfReader(p) for p in inputs]
-
-    if args.mode == "2up":
-        build_writer_2up(
-            readers,
-            out_path,
-            sheet_size=args.sheet,
-            align=args.align,
-            stop_mode=args.stop,
-            margin_in=args.margin_in,
-            gutter_in=args.gutter_in,
-            zoom=args.zoom,
-        )
-    else:
-        build_writer_4up(
-            readers,
-            out_path,
-            sheet_size=args.sheet,
-            orientation=args.orientation,
-            align=args.align,
-            stop_mode=args.stop,
-            margin_in=args.margin_in,
-            gutter_x_in=args.gutter_in,
-            gutter_y_in=args.gutter_y_in,
-            zoom=args.zoom,
-        )
+    try:
+        build_layout(args, inputs, out_path, jobs=args.jobs or 1)
+    except (RuntimeError, ValueError) as e:
+        print("Error:", e)
+        return
 
     print("Wrote:", out_path)
+    tool_progress.artifact(out_path, "pdf")
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
@@ -1,37 +1,94 @@
 #!/usr/bin/env python
+import time
+_startup_t0 = time.perf_counter()  # --profile-startup measures from here
 import PySimpleGUI as sg
 import subprocess
 import threading
 import queue
 import sys
 import os
-
-# try to import PyMuPDF for PDF preview
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    fitz = None
-
-# try to import Pillow for image preview
-try:
-    from PIL import Image
-    from io import BytesIO
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+import codecs
+from io import BytesIO, IncrementalNewlineDecoder
+
+# shared PDF index
+from pdf_catalog import find_pdfs, SearchWorker
+from page_ranges import parse_page_ranges, format_page_ranges
+# preview caches: open documents and rendered pages
+# (PyMuPDF is imported lazily through load_fitz, on the first preview)
+from pdf_preview import DocumentCache, RenderCache, PrefetchWorker, ThumbnailWorker, load_fitz
+# bounded console scrollback with per-tab log files
+from console_buffer import ConsoleBuffer
+# warm worker processes for the tool buttons
+from tool_worker import WorkerPool
+# structured progress / artifact reports from the tools
+from tool_progress import ProgressServer
+# job queue with per-resource limits behind the tool buttons
+from job_scheduler import Job, JobScheduler, QUEUED, FAILED
 
 # ---------- configuration ----------
-PDF_FOLDERS = [
-    r"C:\Users\benoi\Downloads\ebay_manuals",
-    r"C:\Users\benoi\Downloads\manuals",
-]
-
 # Default is now Tahoma (as requested). Toggle will switch to Consolas.
 DEFAULT_OUTPUT_FONT = ("Tahoma", 10)
 ALT_OUTPUT_FONT = ("Consolas", 10)
 MAX_TABS = 6
+CONSOLE_MAX_LINES = 20000  # ring buffer size per console tab
+CONSOLE_VISIBLE_LINES = 1000  # lines kept in the Multiline widget
+CONSOLE_LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "console_logs")
+WARM_WORKERS = 2  # idle pre-warmed tool processes (0 = spawn a fresh interpreter per click)
+WARM_POOL_DELAY = 1.0  # seconds after the window is up before the warm workers start
+MAX_OPEN_PDFS = 4  # open fitz documents kept by the preview cache
+PREVIEW_CACHE_MB = 64  # memory budget for rendered preview images
+# on-disk tier for rendered previews (set to None to disable)
+PREVIEW_DISK_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "preview_cache")
+PREVIEW_DISK_CACHE_MB = 256
+PREFETCH_PAGES = 2  # pages rendered ahead on each side of the preview
+FAST_PREVIEW_SCALE = 0.35  # raster scale (vs. target size) used while scrubbing
+SCRUB_WINDOW = 0.3  # seconds between page flips that count as scrubbing
+SHARP_RENDER_DELAY = 0.25  # idle seconds before the sharp render replaces a fast one
+THUMB_HEIGHT = 110  # pixel height of the thumbnail strip images
+THUMB_SLOTS = 4  # thumbnails visible at once
+THUMB_AHEAD = 40  # pages rendered on each side of the visible thumbnails
+THUMB_CACHE_MB = 16
+# thumbnails are kept on disk and reused across sessions (None to disable)
+THUMB_DISK_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "thumb_cache")
+THUMB_DISK_CACHE_MB = 64
+EXPORT_DEFAULT_DPI = 300  # "Save image" resolution unless a pixel height ("2000px") is given
+EXPORT_JPEG_QUALITY = 92
+
+# ---------- startup profiling ----------
+PROFILE_STARTUP = "--profile-startup" in sys.argv[1:]
+startup_marks = []  # (phase, perf_counter) in order
+
+def mark_startup(phase):
+    if PROFILE_STARTUP:
+        startup_marks.append((phase, time.perf_counter()))
+
+def startup_report():
+    """Phase-by-phase timing breakdown printed for --profile-startup."""
+    lines = ["Startup profile:"]
+    prev = _startup_t0
+    for phase, t in startup_marks:
+        lines.append(f"  {phase:<18}{t - prev:8.3f} s")
+        prev = t
+    lines.append(f"  {'total':<18}{prev - _startup_t0:8.3f} s")
+    return "\n".join(lines) + "\n"
+
+mark_startup("imports")
 
 # ---------- helpers ----------
+_pil_image = None
+
+def load_pil():
+    """Import Pillow's Image module on first use; None if Pillow is missing."""
+    global _pil_image
+    if _pil_image is None:
+        try:
+            from PIL import Image
+        except ImportError:
+            _pil_image = False
+        else:
+            _pil_image = Image
+    return _pil_image or None
+
 def list_cover_images():
     """List all PNG/JPG in cwd, excluding middle.png and lightscribe_ebay.jpg, cover.png first."""
     exts = {".png", ".jpg"}
@@ -48,45 +105,184 @@ def list_cover_images():
     return files or ["cover.png"]
 
 def fuzzy_find_pdfs(partial: str):
-    """Case-insensitive contains search across PDF_FOLDERS."""
-    partial_lower = partial.lower()
-    matches = []
-    for folder in PDF_FOLDERS:
-        if not os.path.isdir(folder):
-            continue
-        for f in os.listdir(folder):
-            if f.lower().endswith(".pdf") and partial_lower in f.lower():
-                matches.append(os.path.join(folder, f))
-    return matches
+    """Case-insensitive contains search across PDF_FOLDERS (served from the shared index)."""
+    return find_pdfs(partial)
+
+doc_cache = DocumentCache(max_docs=MAX_OPEN_PDFS)
+render_cache = RenderCache(
+    max_bytes=PREVIEW_CACHE_MB * 1024 * 1024,
+    disk_dir=PREVIEW_DISK_CACHE_DIR,
+    disk_max_bytes=PREVIEW_DISK_CACHE_MB * 1024 * 1024,
+)
 
 def get_pdf_page_count(pdf_path):
-    if fitz is None or not pdf_path or not os.path.exists(pdf_path):
+    if load_fitz() is None or not pdf_path or not os.path.exists(pdf_path):
         return None
-    try:
-        doc = fitz.open(pdf_path)
+    with doc_cache.lock:
+        doc = doc_cache.get(pdf_path)
+        if doc is None:
+            return None
         return doc.page_count
-    except Exception:
-        return None
+
+def preview_cache_key(pdf_path, page_index, max_height=800):
+    return (os.path.abspath(pdf_path), os.path.getmtime(pdf_path), page_index, max_height)
 
 def render_pdf_page_to_bytes(pdf_path, page_index=0, max_height=800):
-    if fitz is None:
+    if load_fitz() is None:
         return None
     try:
-        doc = fitz.open(pdf_path)
-        if page_index < 0 or page_index >= doc.page_count:
+        cache_key = preview_cache_key(pdf_path, page_index, max_height)
+    except (OSError, TypeError):
+        return None
+    img_bytes = render_cache.get(cache_key)
+    if img_bytes is None:
+        img_bytes = _render_pdf_page(pdf_path, page_index, max_height)
+        render_cache.put(cache_key, img_bytes)
+    return img_bytes
+
+def _preview_matrix(page, max_height):
+    """Scale computed from page.rect (72 dpi, rotation applied) so pages render once."""
+    scale = min(1.0, max_height / page.rect.height) if page.rect.height else 1.0
+    return load_fitz().Matrix(scale, scale)
+
+def _render_pdf_page(pdf_path, page_index, max_height):
+    with doc_cache.lock:
+        doc = doc_cache.get(pdf_path)
+        if doc is None:
+            return None
+        try:
+            if page_index < 0 or page_index >= doc.page_count:
+                return None
+            page = doc.load_page(page_index)
+            pix = page.get_pixmap(matrix=_preview_matrix(page, max_height))
+            return pix.tobytes("png")
+        except Exception:
             return None
-        page = doc.load_page(page_index)
-        pix = page.get_pixmap()
-        if pix.height > max_height:
-            scale = max_height / pix.height
-            mat = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat)
-        return pix.tobytes("png")
+
+def _embedded_thumbnail(doc, page):
+    """Return the page's embedded /Thumb image as a Pixmap, or None."""
+    fitz = load_fitz()
+    try:
+        kind, value = doc.xref_get_key(page.xref, "Thumb")
+        if kind != "xref":
+            return None
+        thumb = fitz.Pixmap(doc, int(value.split()[0]))
+        if thumb.colorspace is None or thumb.colorspace.n not in (1, 3) or thumb.alpha:
+            thumb = fitz.Pixmap(fitz.csRGB, thumb)
+        return thumb
     except Exception:
         return None
 
+def render_pdf_page_fast(pdf_path, page_index=0, max_height=800):
+    """
+    Cheap preview for scrubbing: the embedded thumbnail if the page has one,
+    else a low-resolution raster, stretched to the size of the sharp render.
+    """
+    fitz = load_fitz()
+    if fitz is None:
+        return None
+    with doc_cache.lock:
+        doc = doc_cache.get(pdf_path)
+        if doc is None:
+            return None
+        try:
+            if page_index < 0 or page_index >= doc.page_count:
+                return None
+            page = doc.load_page(page_index)
+            mat = _preview_matrix(page, max_height)
+            target = page.rect * mat
+            pix = _embedded_thumbnail(doc, page)
+            if pix is None:
+                low = FAST_PREVIEW_SCALE
+                pix = page.get_pixmap(matrix=mat * fitz.Matrix(low, low), alpha=False)
+            pix = fitz.Pixmap(pix, max(1, int(target.width)), max(1, int(target.height)), None)
+            return pix.tobytes("png")
+        except Exception:
+            return None
+
+def prefetch_pdf_page(pdf_path, page_index, max_height=800):
+    """Render a page into render_cache (background worker, no hit/miss counting)."""
+    cache_key = preview_cache_key(pdf_path, page_index, max_height)
+    if not render_cache.contains(cache_key):
+        render_cache.put(cache_key, _render_pdf_page(pdf_path, page_index, max_height))
+
+prefetcher = PrefetchWorker(prefetch_pdf_page, radius=PREFETCH_PAGES)
+
+thumb_cache = RenderCache(
+    max_bytes=THUMB_CACHE_MB * 1024 * 1024,
+    disk_dir=THUMB_DISK_CACHE_DIR,
+    disk_max_bytes=THUMB_DISK_CACHE_MB * 1024 * 1024,
+)
+
+# 1x1 transparent PNG shown in empty thumbnail slots
+BLANK_THUMB = b"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAAC0lEQVR4nGNgAAIAAAUAAXpeqz8AAAAASUVORK5CYII="
+
+def render_thumbnail(pdf_path, page_index):
+    """Thumbnail PNG bytes for one page (thumbnail worker threads)."""
+    try:
+        cache_key = preview_cache_key(pdf_path, page_index, THUMB_HEIGHT)
+    except (OSError, TypeError):
+        return None
+    img_bytes = thumb_cache.get(cache_key)
+    if img_bytes is None:
+        img_bytes = _render_pdf_page(pdf_path, page_index, THUMB_HEIGHT)
+        thumb_cache.put(cache_key, img_bytes)
+    return img_bytes
+
+def parse_export_resolution(text):
+    """"300" -> ("dpi", 300); "2000px" -> ("px", 2000). Raises ValueError."""
+    text = (text or "").strip().lower()
+    if not text:
+        return "dpi", EXPORT_DEFAULT_DPI
+    if text.endswith("px"):
+        kind, value = "px", int(text[:-2])
+    else:
+        kind, value = "dpi", int(text.removesuffix("dpi"))
+    if value <= 0:
+        raise ValueError(f"invalid resolution '{text}'")
+    return kind, value
+
+def export_pdf_pages(pdf_path, pages, fmt, resolution, out_dir):
+    """
+    Render pages (1-based) straight from the fitz pixmap to JPG/PNG files.
+    Runs on a worker thread; returns ([(page, path) saved], error messages).
+    """
+    fitz = load_fitz()
+    kind, value = resolution
+    ext = "png" if fmt.upper() == "PNG" else "jpg"
+    base = os.path.splitext(os.path.basename(pdf_path))[0]
+    saved, errors = [], []
+    for page_num in pages:
+        out_path = os.path.join(out_dir, f"{base}_p{page_num}.{ext}")
+        with doc_cache.lock:
+            try:
+                doc = doc_cache.get(pdf_path)
+                if doc is None:
+                    errors.append(f"cannot open {pdf_path}")
+                    break
+                page = doc.load_page(page_num - 1)
+                if kind == "px":
+                    scale = value / page.rect.height
+                    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+                else:
+                    pix = page.get_pixmap(dpi=value, alpha=False)
+                if ext == "jpg":
+                    pix.save(out_path, jpg_quality=EXPORT_JPEG_QUALITY)
+                else:
+                    pix.save(out_path)
+            except Exception as e:
+                errors.append(f"page {page_num}: {e}")
+                continue
+        saved.append((page_num, out_path))
+    return saved, errors
+
+def export_worker(tab_idx, pdf_path, pages, fmt, resolution, out_dir):
+    saved, errors = export_pdf_pages(pdf_path, pages, fmt, resolution, out_dir)
+    window.write_event_value("-EXPORT_DONE-", (tab_idx, pdf_path, saved, errors))
+
 def is_supported_image(path):
-    if not PIL_AVAILABLE:
+    Image = load_pil()
+    if Image is None:
         return False
     try:
         with Image.open(path) as im:
@@ -100,6 +296,7 @@ def load_image_as_png_bytes(path, max_height=800):
         return None
     if not is_supported_image(path):
         return None
+    Image = load_pil()
     try:
         with Image.open(path) as img:
             w, h = img.size
@@ -122,7 +319,7 @@ def open_with_default_app(path):
         else:
             subprocess.Popen(["xdg-open", path])
     except Exception as e:
-        output_queues[get_active_tab()].put(f"ERROR opening file: {e}\n")
+        console_print(get_active_tab(), f"ERROR opening file: {e}\n")
 
 # ---------- tools ----------
 TOOLS = [
@@ -137,6 +334,21 @@ TOOLS = [
     ("Lightscribe print", "lightscribe_print"),  # <-- new button
 ]
 
+# resources each tool takes in the job queue (see job_scheduler.RESOURCE_LIMITS);
+# every job also takes its console tab, and myprint.py the selected printer.
+# label.py asks for its printer itself, so it holds every one it offers
+# (label.PRINTERS), keyed like the printer radio buttons used for myprint.py.
+TOOL_RESOURCES = {
+    "2up.py": ["cpu"],
+    "cover.py": ["cpu"],
+    "batch_cover.py": ["cpu"],
+    "lightscribe.py": ["cpu"],
+    "pdf2png.py": ["cpu"],
+    "label.py": ["printer:Brother HL-L8360CDW [Wireless]", "printer:Brother HL-L3290CDW [Wireless]"],
+    "shipping.py": ["network"],
+    "ebay_shipping.py": ["network"],
+}
+
 # ---------- theme / options ----------
 sg.theme("SystemDefault")
 sg.set_options(button_color=(sg.theme_text_color(), sg.theme_background_color()))
@@ -153,12 +365,25 @@ current_fuzzy_matches = []
 # preview state
 current_pdf_path = None
 current_pdf_pagecount = None
+last_page_flip = 0.0  # time of the previous Prev/Next click
+pending_sharp_page = None  # page shown from a fast render, awaiting the sharp one
+pending_sharp_due = 0.0
+thumb_first = 0  # page index shown in the first thumbnail slot
+thumb_generation = 0  # generation of the last thumbnail request
 
 # per-tab process state
 procs = {i: None for i in range(1, MAX_TABS + 1)}
 output_queues = {i: queue.Queue() for i in range(1, MAX_TABS + 1)}
+output_pending = {i: threading.Event() for i in range(1, MAX_TABS + 1)}  # wake event posted
+console_buffers = {
+    i: ConsoleBuffer(CONSOLE_MAX_LINES, os.path.join(CONSOLE_LOG_DIR, f"console_{i}.log"))
+    for i in range(1, MAX_TABS + 1)
+}
+history_view = {i: False for i in range(1, MAX_TABS + 1)}  # widget shows full scrollback
 last_run_script = {i: None for i in range(1, MAX_TABS + 1)}
-last_generated_cover_path = {i: None for i in range(1, MAX_TABS + 1)}
+current_job = {i: None for i in range(1, MAX_TABS + 1)}  # job id of the last tool started in the tab
+job_seq = 0
+scheduler = JobScheduler()
 using_alt_font = False
 active_tabs_count = 1
 active_tab_index = 1  # 1-based
@@ -217,6 +442,12 @@ col_mid_options = [
         ),
         sg.Button("Open PDF", key="-OPENPDF-")
     ],
+    [sg.Checkbox(
+        "Fast scrub",
+        key="-FASTSCRUB-",
+        default=True,
+        tooltip="While paging quickly, show a low-resolution preview and sharpen it when you stop",
+    )],
 ]
 
 col_right_options = [
@@ -239,7 +470,7 @@ col_right_options = [
 ]
 
 # ---------- tab builder ----------
-def make_console_tab(i: int, visible: bool):
+def make_console_tab(i: int, font=DEFAULT_OUTPUT_FONT):
     return sg.Tab(
         f"Console {i}",
         [
@@ -248,7 +479,7 @@ def make_console_tab(i: int, visible: bool):
                 size=(90, 25),
                 key=f"-OUTPUT-{i}-",
                 autoscroll=True,
-                font=DEFAULT_OUTPUT_FONT,
+                font=font,
                 disabled=True,
                 expand_x=True,
                 expand_y=True,
@@ -258,17 +489,23 @@ def make_console_tab(i: int, visible: bool):
                 sg.Button("Send Command", key=f"-SEND_BTN-{i}-"),
                 sg.Button("Stop", key=f"-STOP-{i}-"),
                 sg.Button("Clear", key=f"-CLEAR-{i}-"),
+                sg.Button("History", key=f"-HISTORY-{i}-",
+                          tooltip=f"Toggle the full in-memory scrollback (last {CONSOLE_MAX_LINES} lines)"),
+                sg.Button("Log", key=f"-LOG-{i}-", tooltip="Open the full log of this console"),
                 sg.Button("+", key=f"-ADD_TAB-{i}-", tooltip="Add a new console tab (max 6)"),
             ],
+            [
+                sg.ProgressBar(100, orientation="h", size=(30, 12), key=f"-PROGRESS-{i}-"),
+                sg.Text("", key=f"-PROGRESSTXT-{i}-", size=(45, 1)),
+            ],
         ],
         key=f"-TAB-{i}-",
-        visible=visible,
         expand_x=True,
         expand_y=True,
     )
 
-# pre-create up to MAX_TABS tabs, only the first visible initially
-tabs = [make_console_tab(1, True)] + [make_console_tab(i, False) for i in range(2, MAX_TABS + 1)]
+# only the first console exists at startup; the others are built by "+"
+tabs = [make_console_tab(1)]
 
 # ---------- layout ----------
 left_column = [
@@ -306,11 +543,37 @@ left_column = [
     ],
 ]
 
+thumb_slots = [
+    sg.Column(
+        [
+            [sg.Image(data=BLANK_THUMB, key=("-THUMBSLOT-", k), size=(THUMB_HEIGHT * 3 // 4, THUMB_HEIGHT),
+                      enable_events=True, tooltip="Show this page")],
+            [sg.Text("", key=("-THUMBLABEL-", k), size=(6, 1), justification="center")],
+        ],
+        element_justification="center",
+        pad=(2, 0),
+    )
+    for k in range(THUMB_SLOTS)
+]
+
 right_column = [
     [sg.Text("Preview:")],
     [sg.Image(key="-PREVIEW-", size=(400, 800))],
     [sg.Push(), sg.Button("← Prev", key="-PREV_PAGE-"), sg.Button("Next →", key="-NEXT_PAGE-"), sg.Push()],
-    [sg.Push(), sg.Button("Save image", key="-SAVE_IMAGE-"), sg.Push()],
+    [sg.Push(), *thumb_slots, sg.Push()],
+    [sg.Slider(range=(1, 1), default_value=1, orientation="h", key="-THUMBSCROLL-",
+               enable_events=True, disable_number_display=True, expand_x=True)],
+    [
+        sg.Push(),
+        sg.Text("Pages:"),
+        sg.Input("", key="-EXPORTPAGES-", size=(10, 1),
+                 tooltip="Pages to save, e.g. 1-5,8 (empty = page on screen)"),
+        sg.Input(str(EXPORT_DEFAULT_DPI), key="-EXPORTRES-", size=(7, 1),
+                 tooltip="Resolution in DPI, or a pixel height such as 2000px"),
+        sg.Combo(["JPG", "PNG"], default_value="JPG", key="-EXPORTFMT-", size=(4, 1), readonly=True),
+        sg.Button("Save image", key="-SAVE_IMAGE-"),
+        sg.Push(),
+    ],
 ]
 
 layout = [
@@ -321,12 +584,16 @@ layout = [
     [
         sg.Text("Status:", size=(8, 1)),
         sg.Text("Idle", key="-STATUS-", expand_x=True),
+        sg.Text("Jobs: 0 running, 0 queued", key="-JOBS-", size=(24, 1), justification="right"),
+        sg.Text("Cache: --", key="-CACHEINFO-", size=(34, 1), justification="right"),
         sg.Text("Pages: --", key="-PAGEINFO-", size=(15, 1), justification="right"),
         sg.Button("Switch Font", key="-SWITCH_FONT-"),
         sg.Button("Exit"),
     ],
 ]
 
+mark_startup("layout")
+
 window = sg.Window(
     "ManualForge",
     layout,
@@ -334,55 +601,237 @@ window = sg.Window(
     icon="logo.ico" if os.path.exists("logo.ico") else None,
     finalize=True,
 )
-# Bind Enter for each tab's send input
-for i in range(1, MAX_TABS + 1):
-    window[f"-SEND-{i}-"].bind("<Return>", "_ENTER")
+mark_startup("window finalize")
+# Bind Enter for the tab's send input
+window["-SEND-1-"].bind("<Return>", "_ENTER")
+# thumbnails are rendered on a worker thread and posted back as events
+thumbnailer = ThumbnailWorker(
+    render_thumbnail,
+    lambda generation, page_index, data: window.write_event_value(("-THUMB-", generation), (page_index, data)),
+)
+if PROFILE_STARTUP:
+    # measured when the main loop receives it
+    window.write_event_value("-STARTUP-", None)
 
 # ---------- subprocess I/O ----------
-def stream_reader_char(stream, q):
+READ_CHUNK = 64 * 1024  # max bytes taken from a pipe per read
+TOOL_ENCODING = "utf-8"  # forced on the tools via PYTHONIOENCODING
+
+def console_print(tab_idx, text):
+    """Queue text for a console tab and wake the main loop (any thread)."""
+    output_queues[tab_idx].put(text)
+    # post at most one wake-up per tab until the main loop drains the queue
+    if not output_pending[tab_idx].is_set():
+        output_pending[tab_idx].set()
+        window.write_event_value(("-OUTPUT-", tab_idx), None)
+
+def stream_reader(stream, tab_idx):
+    """
+    Forward whatever bytes are available on the pipe as one decoded chunk.
+
+    The raw pipe read returns as soon as any data is there, so prompts
+    written without a trailing newline (input()) show up immediately.
+    """
+    decoder = IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(TOOL_ENCODING)(errors="replace"), translate=True
+    )
     while True:
-        ch = stream.read(1)
-        if not ch:
+        data = stream.read(READ_CHUNK)
+        if not data:
             break
-        q.put(ch)
+        text = decoder.decode(data)
+        if text:
+            console_print(tab_idx, text)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        console_print(tab_idx, tail)
     stream.close()
 
-def reader_thread(tab_idx, proc, q):
-    threading.Thread(target=stream_reader_char, args=(proc.stdout, q), daemon=True).start()
-    threading.Thread(target=stream_reader_char, args=(proc.stderr, q), daemon=True).start()
-
-def run_script(tab_idx, script_path, extra_args, auto_inputs=None):
+def process_watcher(tab_idx, proc, readers):
+    """Wait for the process and its output, then post exactly one -PROC_DONE- event."""
+    proc.wait()
+    for t in readers:
+        t.join()
+    window.write_event_value(("-PROC_DONE-", tab_idx), proc)
+
+def reader_thread(tab_idx, proc):
+    readers = [
+        threading.Thread(target=stream_reader, args=(proc.stdout, tab_idx), daemon=True),
+        threading.Thread(target=stream_reader, args=(proc.stderr, tab_idx), daemon=True),
+    ]
+    for t in readers:
+        t.start()
+    threading.Thread(target=process_watcher, args=(tab_idx, proc, readers), daemon=True).start()
+
+def send_line(proc, text):
+    """Write one line to the tool's stdin (answers its input() prompt)."""
+    proc.stdin.write((text + "\n").encode(TOOL_ENCODING))
+    proc.stdin.flush()
+
+def tool_env():
+    env = os.environ.copy()
+    env["PYTHONUNBUFFERED"] = "1"
+    env["PYTHONIOENCODING"] = TOOL_ENCODING
+    return env
+
+# pre-warmed interpreters that already hold the tools' heavy imports; they
+# are started from the main loop (-WARM_POOL-) once the window is up, so
+# they don't compete with the GUI's own cold start
+tool_pool = WorkerPool(size=WARM_WORKERS, env=tool_env()) if WARM_WORKERS > 0 else None
+if tool_pool is not None:
+    warm_pool_timer = threading.Timer(WARM_POOL_DELAY, window.write_event_value, ("-WARM_POOL-", None))
+    warm_pool_timer.daemon = True
+    warm_pool_timer.start()
+
+def on_progress_message(msg):
+    """Called from the progress server threads: forward to the main loop."""
+    try:
+        tab_idx = int(str(msg.get("job")).split(":")[0])
+    except ValueError:
+        return
+    if 1 <= tab_idx <= MAX_TABS:
+        window.write_event_value(("-PROGRESS-", tab_idx), msg)
+
+progress_server = ProgressServer(on_progress_message)
+
+def handle_progress_message(tab_idx, msg):
+    kind = msg.get("type")
+    if kind == "progress":
+        total = max(1, int(msg.get("total") or 1))
+        done = min(int(msg.get("done") or 0), total)
+        window[f"-PROGRESS-{tab_idx}-"].update(current_count=done, max=total)
+        text = f"{msg.get('label') or 'progress'}: {done}/{total}"
+        if msg.get("eta") is not None:
+            text += f" – ETA {msg['eta']:.0f} s"
+        window[f"-PROGRESSTXT-{tab_idx}-"].update(text)
+    elif kind == "artifact":
+        path = msg.get("path")
+        if not path or not os.path.exists(path):
+            return
+        if msg.get("kind") == "image":
+            update_preview_from_image(path)
+        elif msg.get("kind") == "pdf":
+            set_pdf_preview(path, page=1)
+    elif kind == "timing":
+        console_print(tab_idx, f"[{last_run_script[tab_idx]}] {msg.get('phase', '?')}: {float(msg.get('seconds') or 0):.2f} s\n")
+
+def run_script(tab_idx, script_path, extra_args, auto_inputs=None, job_id=None):
+    """Start script_path in tab_idx now. Returns True if the process started."""
+    global job_seq
     cmd = [sys.executable, "-u", script_path]
     if extra_args:
         cmd.extend(extra_args)
-    env = os.environ.copy()
-    env["PYTHONUNBUFFERED"] = "1"
+    if job_id is None:
+        job_seq += 1
+        job_id = f"{tab_idx}:{job_seq}"
+    job_env = progress_server.env_for(job_id)
     try:
-        procs[tab_idx] = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            stdin=subprocess.PIPE,
-            text=True,
-            bufsize=0,
-            env=env,
-        )
+        if tool_pool is not None:
+            procs[tab_idx] = tool_pool.run(script_path, extra_args, cwd=os.getcwd(), env=job_env)
+        else:
+            procs[tab_idx] = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.PIPE,
+                bufsize=0,
+                env={**tool_env(), **job_env},
+            )
         last_run_script[tab_idx] = os.path.basename(script_path)
-    except FileNotFoundError:
-        output_queues[tab_idx].put(f"ERROR: could not start {script_path}\n")
+    except (FileNotFoundError, OSError):
+        console_print(tab_idx, f"ERROR: could not start {script_path}\n")
         window["-STATUS-"].update(f"Tab {tab_idx}: ERROR: script not found")
-        return
-    reader_thread(tab_idx, procs[tab_idx], output_queues[tab_idx])
-    output_queues[tab_idx].put(f"Started (Tab {tab_idx}): {' '.join(cmd)}\n")
+        return False
+    current_job[tab_idx] = job_id
+    window[f"-PROGRESS-{tab_idx}-"].update(current_count=0, max=100)
+    window[f"-PROGRESSTXT-{tab_idx}-"].update("")
+    reader_thread(tab_idx, procs[tab_idx])
+    console_print(tab_idx, f"Started (Tab {tab_idx}): {' '.join(cmd)}\n")
     window["-STATUS-"].update(f"Tab {tab_idx}: Running {os.path.basename(script_path)}")
     window[f"-SEND-{tab_idx}-"].set_focus()
     if auto_inputs:
         for item in auto_inputs:
             try:
-                procs[tab_idx].stdin.write(item + "\n")
-                procs[tab_idx].stdin.flush()
+                send_line(procs[tab_idx], item)
             except Exception as e:
-                output_queues[tab_idx].put(f"ERROR sending auto input: {e}\n")
+                console_print(tab_idx, f"ERROR sending auto input: {e}\n")
+    return True
+
+# ---------- job queue ----------
+def submit_tool_job(tab_idx, script_path, extra_args, auto_inputs, resources):
+    """Queue a tool run shown in tab_idx; it starts when its resources are free."""
+    global job_seq
+    job_seq += 1
+    job = scheduler.submit(Job(
+        f"{tab_idx}:{job_seq}",
+        os.path.basename(script_path),
+        list(resources) + [f"tab:{tab_idx}"],
+        tab_idx,
+        script_path=script_path,
+        extra_args=extra_args,
+        auto_inputs=auto_inputs,
+    ))
+    start_ready_jobs()
+    if job.state == QUEUED:
+        console_print(tab_idx, f"Queued {job.label} (waiting for {', '.join(scheduler.blocking(job))})\n")
+        window["-STATUS-"].update(f"Tab {tab_idx}: {job.label} queued")
+        update_tab_title(tab_idx)
+    return job
+
+def start_ready_jobs():
+    """Start every queued job whose resources are free."""
+    started = True
+    while started:
+        started = False
+        for job in scheduler.ready():
+            started = True
+            params = job.params
+            if run_script(job.tab, params["script_path"], params["extra_args"],
+                          auto_inputs=params["auto_inputs"], job_id=job.job_id):
+                job.proc = procs[job.tab]
+            else:
+                scheduler.finish(job, state=FAILED)
+            update_tab_title(job.tab)
+    scheduler.prune()
+    window["-JOBS-"].update(scheduler.summary())
+
+def finish_tab_jobs(tab_idx, proc):
+    """A tool process exited: close its job and start what was waiting."""
+    for job in scheduler.running(tab_idx):
+        if job.proc is proc:
+            scheduler.finish(job, proc.returncode)
+            console_print(tab_idx, f"[{job.label} {job.state}, exit code {proc.returncode}, {job.elapsed():.1f} s]\n")
+    start_ready_jobs()
+    update_tab_title(tab_idx)
+
+def update_tab_title(tab_idx):
+    """Tab title shows the job it is a view of: "Console 2 · 2up.py (running)"."""
+    job = scheduler.latest(tab_idx)
+    title = f"Console {tab_idx}"
+    if job is not None:
+        title += f" · {job.label} ({job.state})"
+        waiting = len(scheduler.queued(tab_idx)) - (job.state == QUEUED)
+        if waiting:
+            title += f" +{waiting}"
+    window[f"-TAB-{tab_idx}-"].update(title=title)
+
+def tab_is_free(tab_idx):
+    return not scheduler.running(tab_idx) and not scheduler.queued(tab_idx) and procs[tab_idx] is None
+
+def pick_job_tab():
+    """
+    Tab for a new job: the active tab if it is free, else the first free
+    tab, else a new tab, else the active tab (the job waits for it).
+    """
+    active = get_active_tab()
+    if tab_is_free(active):
+        return active
+    for i in range(1, active_tabs_count + 1):
+        if tab_is_free(i):
+            return i
+    if active_tabs_count < MAX_TABS:
+        return add_console_tab()
+    return active
 
 # ---------- preview helpers ----------
 def set_pdf_preview(pdf_path, page=1):
@@ -391,9 +840,11 @@ def set_pdf_preview(pdf_path, page=1):
     current_pdf_path = pdf_path
     if not pdf_path or not os.path.exists(pdf_path):
         current_pdf_pagecount = None
+        prefetcher.cancel()
         window["-PAGEINFO-"].update("Pages: --")
         window["-PREVIEW-"].update(data=None)
         window["-PREVIEWPAGE-"].update(values=["1"], value="1")
+        show_thumbnails(0)
         return
 
     pagecount = get_pdf_page_count(pdf_path)
@@ -402,35 +853,141 @@ def set_pdf_preview(pdf_path, page=1):
         window["-PAGEINFO-"].update(f"Pages: {pagecount}")
         pages = [str(i) for i in range(1, pagecount + 1)]
         window["-PREVIEWPAGE-"].update(values=pages, value=str(min(page, pagecount)))
-        img_bytes = render_pdf_page_to_bytes(pdf_path, page_index=min(page, pagecount) - 1)
-        if img_bytes:
-            window["-PREVIEW-"].update(data=img_bytes)
-        else:
-            window["-PREVIEW-"].update(data=None)
+        window["-THUMBSCROLL-"].update(range=(1, max(1, pagecount - THUMB_SLOTS + 1)))
+        show_thumbnails(min(page, pagecount) - 1)
+        render_preview_page(min(page, pagecount))
     else:
+        prefetcher.cancel()
         window["-PAGEINFO-"].update("Pages: --")
         window["-PREVIEWPAGE-"].update(values=["1"], value="1")
         window["-PREVIEW-"].update(data=None)
+        show_thumbnails(0)
 
 def update_preview_from_image(path):
     img_bytes = load_image_as_png_bytes(path, max_height=800)
     if img_bytes:
         window["-PREVIEW-"].update(data=img_bytes)
 
-def render_current_preview_page(values):
-    """Render the page number currently selected in the combobox."""
+def render_preview_page(page_num, fast=False):
+    """
+    Show page_num (1-based) of the current PDF, then prefetch its neighbours.
+
+    With fast=True and no cached sharp render, a cheap preview is shown and
+    the sharp render is deferred until the user stops flipping pages.
+    """
+    global pending_sharp_page, pending_sharp_due
+    pending_sharp_page = None
     if not current_pdf_path or not current_pdf_pagecount:
         return
+    page_num = max(1, min(page_num, current_pdf_pagecount))
+    # drop stale prefetch work before rendering on the UI thread
+    prefetcher.cancel()
+
+    if fast:
+        if not render_cache.contains(preview_cache_key(current_pdf_path, page_num - 1)):
+            img_bytes = render_pdf_page_fast(current_pdf_path, page_index=page_num - 1)
+            if img_bytes:
+                window["-PREVIEW-"].update(data=img_bytes)
+                pending_sharp_page = page_num
+                pending_sharp_due = time.monotonic() + SHARP_RENDER_DELAY
+                return
+
+    img_bytes = render_pdf_page_to_bytes(current_pdf_path, page_index=page_num - 1)
+    window["-PREVIEW-"].update(data=img_bytes if img_bytes else None)
+    window["-CACHEINFO-"].update(render_cache.stats_text())
+    prefetcher.schedule(current_pdf_path, page_num - 1, current_pdf_pagecount)
+    follow_thumbnails(page_num)
+
+def show_thumbnails(first):
+    """Point the thumbnail strip at page index `first` and request its images."""
+    global thumb_first, thumb_generation
+    count = current_pdf_pagecount or 0
+    thumb_first = max(0, min(first, count - THUMB_SLOTS))
+    for k in range(THUMB_SLOTS):
+        page_index = thumb_first + k
+        window[("-THUMBSLOT-", k)].update(data=BLANK_THUMB, size=(THUMB_HEIGHT * 3 // 4, THUMB_HEIGHT))
+        window[("-THUMBLABEL-", k)].update(str(page_index + 1) if page_index < count else "")
+    window["-THUMBSCROLL-"].update(value=thumb_first + 1)
+    if count:
+        thumb_generation = thumbnailer.request(current_pdf_path, thumb_first, THUMB_SLOTS, count, THUMB_AHEAD)
+    else:
+        thumbnailer.cancel()
+
+def search_and_warm_preview(text, cancelled):
+    """
+    Live search step run on the search thread: look up matches and render
+    page 1 of the first one into the caches, so showing it is instant.
+    """
+    matches = fuzzy_find_pdfs(text)
+    if matches and not cancelled():
+        if get_pdf_page_count(matches[0]) and not cancelled():
+            render_pdf_page_to_bytes(matches[0], page_index=0)
+    return matches
+
+def show_search_matches(matches):
+    """Fill the results combo and preview the first match."""
+    global current_fuzzy_matches
+    current_fuzzy_matches = matches or []
+    if matches:
+        window["-SEARCHRESULT-"].update(
+            values=[os.path.basename(m) for m in matches],
+            value=os.path.basename(matches[0]),
+        )
+        set_pdf_preview(matches[0], page=1)
+    else:
+        window["-SEARCHRESULT-"].update(values=["(no matches)"], value="(no matches)")
+        set_pdf_preview(None)
+
+def follow_thumbnails(page_num):
+    """Scroll the strip only when page_num (1-based) is outside it."""
+    if not thumb_first < page_num <= thumb_first + THUMB_SLOTS:
+        show_thumbnails(page_num - 1)
+
+def render_current_preview_page(values):
+    """Render the page number currently selected in the combobox."""
     try:
         page_num = int(values["-PREVIEWPAGE-"])
     except Exception:
         page_num = 1
-    page_num = max(1, min(page_num, current_pdf_pagecount))
-    img_bytes = render_pdf_page_to_bytes(current_pdf_path, page_index=page_num - 1)
-    if img_bytes:
-        window["-PREVIEW-"].update(data=img_bytes)
+    render_preview_page(page_num)
+
+# ---------- console helpers ----------
+def append_console(i, text):
+    """Record text in the tab's ring buffer/log and show it in the widget."""
+    console_buffers[i].append(text)
+    window[f"-OUTPUT-{i}-"].update(text, append=True)
+    if not history_view[i]:
+        trim_console_widget(i)
+
+def trim_console_widget(i, keep=CONSOLE_VISIBLE_LINES):
+    """Delete the oldest lines so the widget only holds the visible window."""
+    widget = window[f"-OUTPUT-{i}-"].Widget
+    line_count = int(widget.index("end-1c").split(".")[0])
+    excess = line_count - keep
+    if excess <= 0:
+        return
+    state = widget.cget("state")
+    widget.configure(state="normal")
+    widget.delete("1.0", f"{excess + 1}.0")
+    widget.configure(state=state)
+
+def toggle_history_view(i):
+    """Switch between the visible tail and the whole ring buffer."""
+    history_view[i] = not history_view[i]
+    window[f"-OUTPUT-{i}-"].update(console_buffers[i].text())
+    if not history_view[i]:
+        trim_console_widget(i)
 
 # ---------- tab utils ----------
+def add_console_tab():
+    """Build the next console tab (with the current font) and return its index."""
+    global active_tabs_count
+    active_tabs_count += 1
+    window["-TABS-"].add_tab(make_console_tab(
+        active_tabs_count, ALT_OUTPUT_FONT if using_alt_font else DEFAULT_OUTPUT_FONT))
+    window[f"-SEND-{active_tabs_count}-"].bind("<Return>", "_ENTER")
+    return active_tabs_count
+
 def select_tab(idx):
     """Select tab idx (1-based) in the TabGroup."""
     try:
@@ -438,9 +995,31 @@ def select_tab(idx):
     except Exception:
         pass
 
+# ---------- search worker ----------
+# live search runs debounced on its own thread; -SEARCH_DONE- carries (seq, matches)
+search_worker = SearchWorker(
+    search_and_warm_preview,
+    lambda seq, query, matches: window.write_event_value("-SEARCH_DONE-", (seq, matches)),
+)
+search_seq = 0  # seq of the last query typed
+
 # ---------- main loop ----------
 while True:
-    event, values = window.read(timeout=100)
+    # block until real work arrives; only wake up on our own for a pending sharp render
+    if pending_sharp_page is not None:
+        timeout = max(0, int((pending_sharp_due - time.monotonic()) * 1000))
+    else:
+        timeout = None
+    event, values = window.read(timeout=timeout)
+
+    if event == "-STARTUP-":
+        mark_startup("first event")
+        report = startup_report()
+        print(report, end="")
+        console_print(1, report)
+
+    if event == "-WARM_POOL-":
+        tool_pool.fill()
 
     if event in (sg.WIN_CLOSED, "Exit"):
         for i in range(1, MAX_TABS + 1):
@@ -460,35 +1039,27 @@ while True:
     for i in range(1, MAX_TABS + 1):
         if event == f"-ADD_TAB-{i}-":
             if active_tabs_count < MAX_TABS:
-                active_tabs_count += 1
-                window[f"-TAB-{active_tabs_count}-"].update(visible=True)
+                add_console_tab()
                 select_tab(active_tabs_count)
                 active_tab_index = active_tabs_count
                 # focus the new tab's input for immediate typing
                 window[f"-SEND-{active_tabs_count}-"].set_focus()
             else:
-                output_queues[get_active_tab()].put("Max tabs reached (6).\n")
+                console_print(get_active_tab(), "Max tabs reached (6).\n")
 
-    # live PDF search
+    # live PDF search: debounced on the search thread, older queries discarded
     if event == "-SEARCHTXT-":
         text = values["-SEARCHTXT-"].strip()
         if text:
-            matches = fuzzy_find_pdfs(text)
-            current_fuzzy_matches = matches
-            if matches:
-                window["-SEARCHRESULT-"].update(
-                    values=[os.path.basename(m) for m in matches],
-                    value=os.path.basename(matches[0]),
-                )
-                set_pdf_preview(matches[0], page=1)
-            else:
-                current_fuzzy_matches = []
-                window["-SEARCHRESULT-"].update(values=["(no matches)"], value="(no matches)")
-                set_pdf_preview(None)
+            search_seq = search_worker.submit(text)
         else:
-            current_fuzzy_matches = []
-            window["-SEARCHRESULT-"].update(values=["(no matches)"], value="(no matches)")
-            set_pdf_preview(None)
+            search_seq = search_worker.cancel()
+            show_search_matches([])
+
+    if event == "-SEARCH_DONE-":
+        seq, matches = values[event]
+        if seq == search_seq:
+            show_search_matches(matches)
 
     # user picks one of the matches
     if event == "-SEARCHRESULT-":
@@ -515,67 +1086,90 @@ while True:
             else:
                 page_num = min(current_pdf_pagecount, page_num + 1)
             window["-PREVIEWPAGE-"].update(value=str(page_num))
-            render_current_preview_page(values)
+            now = time.monotonic()
+            scrubbing = values.get("-FASTSCRUB-", False) and now - last_page_flip < SCRUB_WINDOW
+            last_page_flip = now
+            render_preview_page(page_num, fast=scrubbing)
+
+    # thumbnail strip: scrolled with the slider, a click shows that page
+    if event == "-THUMBSCROLL-" and int(values["-THUMBSCROLL-"]) - 1 != thumb_first:
+        show_thumbnails(int(values["-THUMBSCROLL-"]) - 1)
+
+    if isinstance(event, tuple) and event[0] == "-THUMBSLOT-":
+        page_num = thumb_first + event[1] + 1
+        if current_pdf_pagecount and page_num <= current_pdf_pagecount:
+            window["-PREVIEWPAGE-"].update(value=str(page_num))
+            render_preview_page(page_num)
+
+    if isinstance(event, tuple) and event[0] == "-THUMB-":
+        page_index, img_bytes = values[event]
+        k = page_index - thumb_first
+        if event[1] == thumb_generation and img_bytes and 0 <= k < THUMB_SLOTS:
+            window[("-THUMBSLOT-", k)].update(data=img_bytes)
+
+    # user stopped scrubbing: swap the fast preview for the sharp render
+    if pending_sharp_page is not None and time.monotonic() >= pending_sharp_due:
+        render_preview_page(pending_sharp_page)
 
     # open PDF with default app
     if event == "-OPENPDF-":
         if current_pdf_path and os.path.exists(current_pdf_path):
             open_with_default_app(current_pdf_path)
         else:
-            output_queues[get_active_tab()].put("No PDF selected to open.\n")
+            console_print(get_active_tab(), "No PDF selected to open.\n")
 
-    # save current PDF preview page as JPG
+    # save PDF page(s) as JPG/PNG at full resolution, on a worker thread
     if event == "-SAVE_IMAGE-":
         tab_idx = get_active_tab()
 
-        if fitz is None:
-            output_queues[tab_idx].put("Cannot save preview: PyMuPDF (fitz) is not available.\n")
+        if load_fitz() is None:
+            console_print(tab_idx, "Cannot save preview: PyMuPDF (fitz) is not available.\n")
             window["-STATUS-"].update("Cannot save preview (no PyMuPDF)")
         elif current_pdf_path is None or not os.path.exists(current_pdf_path):
-            output_queues[tab_idx].put("No PDF page preview to save.\n")
+            console_print(tab_idx, "No PDF page preview to save.\n")
             window["-STATUS-"].update("No PDF page preview to save")
-        elif not PIL_AVAILABLE:
-            output_queues[tab_idx].put("Cannot save as JPG: Pillow (PIL) is not available.\n")
-            window["-STATUS-"].update("Cannot save as JPG (no Pillow)")
         else:
-            # determine current page number from the combobox
             try:
-                page_num = int(values["-PREVIEWPAGE-"])
-            except Exception:
-                page_num = 1
-
-            # get PNG bytes for that page
-            png_bytes = render_pdf_page_to_bytes(current_pdf_path, page_index=page_num - 1)
-            if not png_bytes:
-                output_queues[tab_idx].put("Failed to render current PDF page.\n")
-                window["-STATUS-"].update("Failed to render current PDF page")
+                if values["-EXPORTPAGES-"].strip():
+                    pages = parse_page_ranges(values["-EXPORTPAGES-"], current_pdf_pagecount)
+                else:
+                    # the page on screen
+                    try:
+                        pages = [int(values["-PREVIEWPAGE-"])]
+                    except Exception:
+                        pages = [1]
+                resolution = parse_export_resolution(values["-EXPORTRES-"])
+            except ValueError as e:
+                console_print(tab_idx, f"Cannot save image: {e}\n")
+                window["-STATUS-"].update("Cannot save image (bad pages or resolution)")
             else:
-                # build output JPG filename: <pdf_name>_p<page>.jpg
-                base = os.path.splitext(os.path.basename(current_pdf_path))[0]
-                out_name = f"{base}_p{page_num}.jpg"
-                out_path = os.path.join(os.getcwd(), out_name)
-
-                try:
-                    # convert PNG bytes -> JPG file using Pillow
-                    bio = BytesIO(png_bytes)
-                    img = Image.open(bio).convert("RGB")
-                    img.save(out_path, "JPEG")
-
-                    msg = f"Saved preview as {out_name}\n"
-                    output_queues[tab_idx].put(msg)
-                    window["-STATUS-"].update(f"Saved preview as {out_name}")
-                except Exception as e:
-                    output_queues[tab_idx].put(f"ERROR saving preview: {e}\n")
-                    window["-STATUS-"].update("ERROR saving preview")
+                threading.Thread(
+                    target=export_worker,
+                    args=(tab_idx, current_pdf_path, pages, values["-EXPORTFMT-"], resolution, os.getcwd()),
+                    daemon=True,
+                ).start()
+                window["-STATUS-"].update(f"Saving {len(pages)} page(s) as {values['-EXPORTFMT-']}...")
+
+    if event == "-EXPORT_DONE-":
+        tab_idx, pdf_path, saved, errors = values[event]
+        for err in errors:
+            console_print(tab_idx, f"ERROR saving image: {err}\n")
+        if len(saved) == 1:
+            out_name = os.path.basename(saved[0][1])
+            console_print(tab_idx, f"Saved page as {out_name}\n")
+            window["-STATUS-"].update(f"Saved page as {out_name}")
+        elif saved:
+            pages = sorted(page_num for page_num, _path in saved)
+            console_print(tab_idx, f"Saved pages {format_page_ranges(pages)} of "
+                                   f"{os.path.basename(pdf_path)} to {os.path.dirname(saved[0][1])}\n")
+            window["-STATUS-"].update(f"Saved {len(saved)} pages")
+        else:
+            window["-STATUS-"].update("ERROR saving image")
 
     # run a tool (uses active tab)
     if isinstance(event, tuple) and event[0] == "RUN_TOOL":
         tab_idx = get_active_tab()
         script = event[1]
-        # --- Force monospace font for inventory.py ---
-        if script == "inventory.py":
-            window[f"-OUTPUT-{tab_idx}-"].update(font=ALT_OUTPUT_FONT)
-
 
         # --- special case: Lightscribe print (external EXE) ---
         if script == "lightscribe_print":
@@ -583,26 +1177,25 @@ while True:
             if os.path.exists(exe_path):
                 try:
                     subprocess.Popen([exe_path])
-                    output_queues[tab_idx].put(f"Started Lightscribe Template Labeler:\n  {exe_path}\n")
+                    console_print(tab_idx, f"Started Lightscribe Template Labeler:\n  {exe_path}\n")
                     window["-STATUS-"].update(f"Tab {tab_idx}: Lightscribe Template Labeler started")
                 except Exception as e:
-                    output_queues[tab_idx].put(f"ERROR launching TemplateLabeler.exe: {e}\n")
+                    console_print(tab_idx, f"ERROR launching TemplateLabeler.exe: {e}\n")
                     window["-STATUS-"].update(f"Tab {tab_idx}: ERROR launching TemplateLabeler.exe")
             else:
-                output_queues[tab_idx].put("ERROR: TemplateLabeler.exe not found at:\n"
-                                           "  C:\\Program Files (x86)\\LightScribe Template Labeler\\TemplateLabeler.exe\n")
+                console_print(tab_idx, "ERROR: TemplateLabeler.exe not found at:\n"
+                                       "  C:\\Program Files (x86)\\LightScribe Template Labeler\\TemplateLabeler.exe\n")
                 window["-STATUS-"].update(f"Tab {tab_idx}: TemplateLabeler.exe not found")
             continue  # skip normal python-script handling for this button
 
         # --- normal Python tools below ---
         script_path = os.path.join(os.getcwd(), script)
         if not os.path.exists(script_path):
-            output_queues[tab_idx].put(f"ERROR: {script_path} not found\n")
+            console_print(tab_idx, f"ERROR: {script_path} not found\n")
             window["-STATUS-"].update(f"Tab {tab_idx}: ERROR: script not found")
         else:
             extra_args = []
             auto_inputs = []
-            selected_pdf_basename = None
 
             scripts_that_need_pdf = {
                 "myprint.py",
@@ -635,74 +1228,113 @@ while True:
                     if current_fuzzy_matches:
                         chosen_basename = values["-SEARCHRESULT-"]
                         if chosen_basename != "(no matches)":
-                            selected_pdf_basename = chosen_basename
                             for idx, fullpath in enumerate(current_fuzzy_matches, start=1):
                                 if os.path.basename(fullpath) == chosen_basename and len(current_fuzzy_matches) > 1:
                                     auto_inputs.append(str(idx))
                                     break
 
-            if script == "cover.py":
-                if selected_pdf_basename:
-                    expected_png = os.path.splitext(selected_pdf_basename)[0] + ".png"
-                    last_generated_cover_path[tab_idx] = os.path.join(os.getcwd(), expected_png)
-                else:
-                    last_generated_cover_path[tab_idx] = None
+            resources = list(TOOL_RESOURCES.get(script, []))
+            if script == "myprint.py":
+                # one job at a time per printer: the label of the selected radio button
+                resources.append("printer:" + window["-PRN1-" if values["-PRN1-"] else "-PRN2-"].Text)
 
-            run_script(tab_idx, script_path, extra_args, auto_inputs=auto_inputs)
+            # the job runs in the active tab if it is free, else in another one
+            tab_idx = pick_job_tab()
+            select_tab(tab_idx)
+            active_tab_index = tab_idx
+            # --- Force monospace font for inventory.py ---
+            if script == "inventory.py":
+                window[f"-OUTPUT-{tab_idx}-"].update(font=ALT_OUTPUT_FONT)
+            submit_tool_job(tab_idx, script_path, extra_args, auto_inputs, resources)
 
     # per-tab controls: Stop / Clear / Send
     for i in range(1, MAX_TABS + 1):
         if event == f"-STOP-{i}-":
+            queued = scheduler.queued(i)
+            for job in queued:
+                scheduler.cancel(job)
+            if queued:
+                console_print(i, f"[{len(queued)} queued job(s) cancelled]\n")
+                update_tab_title(i)
+                window["-JOBS-"].update(scheduler.summary())
             if procs[i] and procs[i].poll() is None:
+                for job in scheduler.running(i):
+                    job.stopped = True
                 procs[i].terminate()
-                output_queues[i].put("\n[Process stopped by user]\n")
+                console_print(i, "\n[Process stopped by user]\n")
                 window["-STATUS-"].update(f"Tab {i}: Stopped")
-            else:
-                output_queues[i].put("No running process to stop.\n")
+            elif not queued:
+                console_print(i, "No running process to stop.\n")
 
         if event == f"-CLEAR-{i}-":
+            console_buffers[i].clear()
+            history_view[i] = False
             window[f"-OUTPUT-{i}-"].update("")
 
+        if event == f"-HISTORY-{i}-":
+            toggle_history_view(i)
+
+        if event == f"-LOG-{i}-":
+            log_path = console_buffers[i].log_path
+            if log_path and os.path.exists(log_path):
+                open_with_default_app(log_path)
+            else:
+                console_print(i, "No log written for this console yet.\n")
+
         if event in (f"-SEND_BTN-{i}-", f"-SEND-{i}-" + "_ENTER"):
             text_to_send = values.get(f"-SEND-{i}-", "")
             if procs[i] and procs[i].poll() is None:
                 try:
-                    procs[i].stdin.write(text_to_send + "\n")
-                    procs[i].stdin.flush()
+                    send_line(procs[i], text_to_send)
                 except Exception as e:
-                    output_queues[i].put(f"ERROR sending input: {e}\n")
+                    console_print(i, f"ERROR sending input: {e}\n")
             else:
-                output_queues[i].put("No running process.\n")
+                console_print(i, "No running process.\n")
             window[f"-SEND-{i}-"].update("")
 
     # toggle fonts for ALL consoles
     if event == "-SWITCH_FONT-":
         using_alt_font = not using_alt_font
         new_font = (ALT_OUTPUT_FONT if using_alt_font else DEFAULT_OUTPUT_FONT)
-        for i in range(1, MAX_TABS + 1):
+        for i in range(1, active_tabs_count + 1):
             window[f"-OUTPUT-{i}-"].update(font=new_font)
 
-    # flush output from all tabs
-    for i in range(1, MAX_TABS + 1):
+    # output arrived for a tab: one coalesced widget update
+    if isinstance(event, tuple) and event[0] == "-OUTPUT-":
+        i = event[1]
+        output_pending[i].clear()
+        chunks = []
         try:
             while True:
-                chunk = output_queues[i].get_nowait()
-                window[f"-OUTPUT-{i}-"].update(chunk, append=True)
+                chunks.append(output_queues[i].get_nowait())
         except queue.Empty:
             pass
+        if chunks:
+            append_console(i, "".join(chunks))
 
-    # processes finished? handle previews
-    for i in range(1, MAX_TABS + 1):
-        if procs[i] and procs[i].poll() is not None:
+    # a process finished (posted once by its watcher thread): handle previews
+    if isinstance(event, tuple) and event[0] == "-PROC_DONE-":
+        i = event[1]
+        if procs[i] is values[event]:
             window["-STATUS-"].update(f"Tab {i}: Idle")
-            if last_run_script[i] == "lightscribe.py":
-                ls_path = os.path.join(os.getcwd(), "lightscribe_ebay.jpg")
-                if os.path.exists(ls_path):
-                    update_preview_from_image(ls_path)
-            if last_run_script[i] == "cover.py":
-                if last_generated_cover_path[i] and os.path.exists(last_generated_cover_path[i]):
-                    update_preview_from_image(last_generated_cover_path[i])
             procs[i] = None
-
+        finish_tab_jobs(i, values[event])
+
+    # structured report from a tool: progress bar, previews of its outputs, timings
+    if isinstance(event, tuple) and event[0] == "-PROGRESS-":
+        i = event[1]
+        msg = values[event]
+        if msg.get("job") == current_job[i]:
+            handle_progress_message(i, msg)
+
+prefetcher.stop()
+thumbnailer.stop()
+search_worker.stop()
+progress_server.close()
+if tool_pool is not None:
+    tool_pool.shutdown()
+doc_cache.close_all()
+for i in range(1, MAX_TABS + 1):
+    console_buffers[i].close()
 window.close()
 
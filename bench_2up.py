@@ -0,0 +1,346 @@
+#!/usr/bin/env python
+"""
+bench_2up.py
+
+Throughput benchmark for 2up.py (nup_pdf.py).
+
+Synthetic manuals are generated locally with PyMuPDF (once, then reused
+from bench_data/):
+
+    text      pages of body text
+    image     a different photo-sized image on every page
+    rotated   text pages cycling through /Rotate 0, 90, 180, 270
+
+at 10, 100 and 1000 pages. Every document is imposed with
+--mode 2up and --mode 4up for every engine and variant (plain,
+streaming in about 4 parts with --chunk-sheets, parallel with --jobs,
+--optimize). Each case runs the 2up.py command line in a fresh process,
+exactly like the GUI does, so its peak memory is its own and process
+pools work with any start method. Wall time includes interpreter start and imports, which
+are the same for every case. The jobs variant needs 2 or more CPUs and
+is recorded as skipped otherwise.
+
+Wall time, peak memory and output bytes go to a JSON baseline:
+
+    python bench_2up.py                         # writes bench_2up.json
+    python bench_2up.py --quick                 # 10 and 100 pages only
+    python bench_2up.py --compare bench_2up.json -o new.json
+
+--compare runs the cases again and flags every one that got slower,
+heavier or bigger than the baseline by more than the tolerances; the
+exit code is 1 if anything regressed.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import re
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+NUP_SCRIPT = os.path.join(BENCH_DIR, "2up.py")
+DATA_DIR = os.path.join(BENCH_DIR, "bench_data")
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "bench_2up.json")
+
+KINDS = ["text", "image", "rotated"]
+SIZES = [10, 100, 1000]
+QUICK_SIZES = [10, 100]
+LAYOUTS = ["2up", "4up"]
+# Extra 2up.py arguments per variant ("chunked" and "jobs" depend on the
+# document and the machine, see variant_args)
+VARIANTS = {
+    "plain": [],
+    "chunked": [],
+    "jobs": [],
+    "optimize": ["--optimize"],
+}
+PARALLEL_JOBS = 4
+# --chunk-sheets for "chunked": the document in about this many parts
+CHUNKS_PER_DOCUMENT = 4
+
+# Relative increase over the baseline reported as a regression.
+TOLERANCES = {"seconds": 0.15, "peak_mb": 0.10, "bytes": 0.02}
+# Timings below this (seconds, process start included) are too noisy to
+# compare (see also --repeat).
+MIN_SECONDS = 1.0
+
+LETTER = (612, 792)
+LOREM = (
+    "Remove the four screws holding the rear panel and lift it off. Check the belt "
+    "tension before adjusting the idler pulley; replace the belt if it is glazed. "
+)
+
+# ---------------------------------------------------------------------------
+# Synthetic documents
+# ---------------------------------------------------------------------------
+
+def make_image(fitz, n: int) -> bytes:
+    """A 480x360 PNG that differs from page to page (no shared image)."""
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 480, 360), False)
+    pix.clear_with(255)
+    for k in range(12):
+        x = (n * 37 + k * 53) % 440
+        y = (n * 23 + k * 29) % 320
+        color = ((n * 7 + k * 40) % 256, (n * 13 + k * 90) % 256, (n * 3 + k * 20) % 256)
+        pix.set_rect(fitz.IRect(x, y, x + 40 + k * 3, y + 30 + k * 2), color)
+    return pix.tobytes("png")
+
+
+def make_pdf(path: str, kind: str, pages: int) -> None:
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    for n in range(pages):
+        page = doc.new_page(width=LETTER[0], height=LETTER[1])
+        page.insert_text((54, 60), "Service manual - page {}".format(n + 1), fontsize=16)
+        if kind == "image":
+            page.insert_image(fitz.Rect(54, 90, 558, 468), stream=make_image(fitz, n))
+            page.insert_textbox(fitz.Rect(54, 490, 558, 740), LOREM * 4, fontsize=10)
+        else:
+            page.insert_textbox(fitz.Rect(54, 90, 558, 740), LOREM * 16, fontsize=10)
+        if kind == "rotated":
+            page.set_rotation((n % 4) * 90)
+    doc.save(path, garbage=1, deflate=True)
+    doc.close()
+
+
+def ensure_documents(kinds: List[str], sizes: List[int], data_dir: str = DATA_DIR) -> Dict[str, Tuple[str, int]]:
+    """Generate the missing synthetic PDFs; return {"kind-pages": (path, pages)}."""
+    os.makedirs(data_dir, exist_ok=True)
+    docs = {}
+    for kind in kinds:
+        for pages in sizes:
+            name = "{}-{}".format(kind, pages)
+            path = os.path.join(data_dir, name + ".pdf")
+            if not os.path.isfile(path):
+                t0 = time.perf_counter()
+                make_pdf(path, kind, pages)
+                print("Generated {} in {:.1f} s".format(os.path.basename(path), time.perf_counter() - t0))
+            docs[name] = (path, pages)
+    return docs
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+def case_key(layout: str, engine: str, variant: str, doc: str) -> str:
+    return "{}/{}/{}/{}".format(layout, engine, variant, doc)
+
+
+def variant_args(variant: str, pages: int):
+    """(2up.py arguments, None), or (None, reason) when the variant cannot run here."""
+    if variant == "chunked":
+        # 2up.py only streams when there are more sheets than --chunk-sheets
+        # (one sheet per page for a single manual)
+        if pages < 2:
+            return None, "a 1-page document cannot be chunked"
+        return ["--chunk-sheets", str(max(1, pages // CHUNKS_PER_DOCUMENT))], None
+    if variant == "jobs":
+        jobs = min(PARALLEL_JOBS, os.cpu_count() or 1)
+        if jobs < 2:
+            return None, "needs 2+ CPUs, this machine has {}".format(os.cpu_count() or 1)
+        return ["--jobs", str(jobs)], None
+    return list(VARIANTS[variant]), None
+
+
+def parse_peak_mb(stdout: str) -> float:
+    """Largest "Peak memory" figure printed by 2up.py (main process or worker)."""
+    match = re.search(r"Peak memory: (\d+) MB(?: \(largest worker: (\d+) MB\))?", stdout)
+    if not match:
+        return 0.0
+    return float(max(int(v) for v in match.groups() if v is not None))
+
+
+def run_case(layout: str, engine: str, variant: str, pdf_path: str, pages: int, repeat: int = 1) -> dict:
+    """Run a case through the 2up.py CLI in fresh processes; keep the fastest of `repeat` runs."""
+    extra, skip_reason = variant_args(variant, pages)
+    if extra is None:
+        return {"skipped": skip_reason}
+    out_path = os.path.join(DATA_DIR, "out_{}_{}_{}.pdf".format(layout, engine, variant))
+    cmd = [sys.executable, NUP_SCRIPT, pdf_path, "--manual-inputs", "-m", layout,
+           "-o", out_path, "--engine", engine] + extra
+    best = None
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            proc = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, cwd=BENCH_DIR)
+            seconds = time.perf_counter() - t0
+            if proc.returncode != 0 or "Wrote:" not in proc.stdout:
+                lines = [l for l in proc.stdout.splitlines() if l.startswith("Error:")]
+                lines += proc.stderr.strip().splitlines()
+                return {"error": (lines or ["exit code {}".format(proc.returncode)])[-1]}
+            result = {
+                "seconds": round(seconds, 3),
+                "peak_mb": parse_peak_mb(proc.stdout),
+                "bytes": os.path.getsize(out_path),
+            }
+            if best is None or result["seconds"] < best["seconds"]:
+                best = result
+    finally:
+        if os.path.exists(out_path):
+            os.remove(out_path)
+    return best
+
+
+def measured(result: Optional[dict]) -> bool:
+    return result is not None and "error" not in result and "skipped" not in result
+
+
+def available_engines() -> List[str]:
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        return ["pypdf"]
+    return ["pypdf", "mupdf"]
+
+
+def run_all(sizes: List[int], kinds: List[str], layouts: List[str], engines: List[str],
+            variants: List[str], repeat: int) -> dict:
+    docs = ensure_documents(kinds, sizes)
+    results = {}
+    for name, (pdf_path, pages) in docs.items():
+        for layout in layouts:
+            for engine in engines:
+                for variant in variants:
+                    key = case_key(layout, engine, variant, name)
+                    result = run_case(layout, engine, variant, pdf_path, pages, repeat)
+                    results[key] = result
+                    if "error" in result:
+                        print("{:<40} ERROR {}".format(key, result["error"]))
+                    elif "skipped" in result:
+                        print("{:<40} SKIPPED ({})".format(key, result["skipped"]))
+                    else:
+                        print("{:<40} {:8.2f} s {:8.0f} MB {:12,d} B".format(
+                            key, result["seconds"], result["peak_mb"], result["bytes"]))
+    return results
+
+
+def environment() -> dict:
+    info = {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        import pypdf
+        info["pypdf"] = pypdf.__version__
+    except ImportError:
+        pass
+    try:
+        import fitz
+        info["pymupdf"] = fitz.VersionBind
+    except ImportError:
+        pass
+    return info
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+def compare(baseline: dict, current: dict, tolerances: Optional[Dict[str, float]] = None) -> List[str]:
+    """Return one line per metric that regressed beyond its tolerance."""
+    tolerances = tolerances or TOLERANCES
+    regressions = []
+    for key, now in sorted(current.items()):
+        before = baseline.get(key)
+        if not measured(before) or "skipped" in now:
+            continue
+        if "error" in now:
+            regressions.append("{}: failed ({})".format(key, now["error"]))
+            continue
+        for metric, tolerance in tolerances.items():
+            old, new = before.get(metric), now.get(metric)
+            if not old or new is None:
+                continue
+            if metric == "seconds" and max(old, new) < MIN_SECONDS:
+                continue
+            change = (new - old) / old
+            if change > tolerance:
+                regressions.append("{}: {} {} -> {} (+{:.0f}%)".format(key, metric, old, new, change * 100))
+    return regressions
+
+
+def print_comparison(baseline: dict, current: dict) -> None:
+    print("\n{:<40} {:>17} {:>17} {:>23}".format("case", "seconds", "peak MB", "bytes"))
+    for key, now in sorted(current.items()):
+        if not (measured(baseline.get(key)) and measured(now)):
+            continue
+        before = baseline[key]
+        print("{:<40} {:>7.2f} -> {:<7.2f} {:>7.0f} -> {:<7.0f} {:>10,d} -> {:<10,d}".format(
+            key, before["seconds"], now["seconds"], before["peak_mb"], now["peak_mb"],
+            before["bytes"], now["bytes"]))
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def parse_list(text: str, allowed: List[str]) -> List[str]:
+    items = [item.strip() for item in text.split(",") if item.strip()]
+    for item in items:
+        if item not in allowed:
+            raise SystemExit("Unknown value '{}' (choose from {})".format(item, ", ".join(allowed)))
+    return items
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark 2up.py layouts across engines and document sizes.")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="JSON file for the results (default bench_2up.json).")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a previous JSON and flag regressions.")
+    parser.add_argument("--quick", action="store_true", help="Only 10 and 100 page documents.")
+    parser.add_argument("--sizes", help="Comma-separated page counts (default 10,100,1000).")
+    parser.add_argument("--kinds", default=",".join(KINDS), help="Comma-separated: text,image,rotated.")
+    parser.add_argument("--layouts", default=",".join(LAYOUTS), help="Comma-separated: 2up,4up.")
+    parser.add_argument("--engines", help="Comma-separated: pypdf,mupdf (default: all installed).")
+    parser.add_argument("--variants", default=",".join(VARIANTS), help="Comma-separated: " + ",".join(VARIANTS) + ".")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case; the fastest is kept. Default 1.")
+    args = parser.parse_args()
+
+    if "mupdf" not in available_engines():
+        print("bench_2up.py needs PyMuPDF to generate its documents (pip install pymupdf).")
+        return 2
+
+    if args.sizes:
+        sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    else:
+        sizes = QUICK_SIZES if args.quick else SIZES
+    kinds = parse_list(args.kinds, KINDS)
+    layouts = parse_list(args.layouts, LAYOUTS)
+    engines = parse_list(args.engines, available_engines()) if args.engines else available_engines()
+    variants = parse_list(args.variants, list(VARIANTS))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    t0 = time.perf_counter()
+    results = run_all(sizes, kinds, layouts, engines, variants, max(1, args.repeat))
+    print("\n{} cases in {:.0f} s".format(len(results), time.perf_counter() - t0))
+
+    if baseline is not None and os.path.abspath(args.output) == os.path.abspath(args.compare):
+        print("Not overwriting the baseline; results not saved (use -o).")
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+        print("Results written to", args.output)
+
+    if baseline is None:
+        return 0
+    print_comparison(baseline, results)
+    regressions = compare(baseline, results)
+    if regressions:
+        print("\n{} regression(s):".format(len(regressions)))
+        for line in regressions:
+            print("  " + line)
+        return 1
+    print("\nNo regression.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+console_buffer.py
+
+Bounded scrollback for the ManualForge.py console tabs.
+
+Each tab keeps its most recent lines in a ring buffer (collections.deque
+with maxlen) while the Multiline widget only shows the tail. Everything a
+tool prints is also spilled to a per-tab log file that can be opened on
+demand, so nothing is lost when lines fall out of the ring buffer.
+"""
+
+import os
+from collections import deque
+from typing import Optional
+
+
+class ConsoleBuffer:
+    """Ring buffer of console lines plus an optional full log file."""
+
+    def __init__(self, max_lines: int, log_path: Optional[str] = None):
+        self.lines = deque(maxlen=max_lines)
+        self.partial = ""  # last line, not terminated by a newline yet
+        self.log_path = log_path
+        self.total_lines = 0
+        self._log = None
+
+    def append(self, text: str) -> None:
+        """Add a chunk of output (may contain several or partial lines)."""
+        if not text:
+            return
+        self._write_log(text)
+        parts = (self.partial + text).split("\n")
+        self.partial = parts.pop()
+        self.lines.extend(parts)
+        self.total_lines += len(parts)
+
+    def text(self) -> str:
+        """Whole ring buffer as one string (what the History view shows)."""
+        body = "\n".join(self.lines)
+        if self.lines:
+            body += "\n"
+        return body + self.partial
+
+    def clear(self) -> None:
+        """Forget the scrollback. The log file keeps everything."""
+        self.lines.clear()
+        self.partial = ""
+
+    def close(self) -> None:
+        if self._log is not None:
+            try:
+                self._log.close()
+            except OSError:
+                pass
+            self._log = None
+
+    def _write_log(self, text: str) -> None:
+        if not self.log_path:
+            return
+        try:
+            if self._log is None:
+                os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+                # one log per tab per GUI session
+                self._log = open(self.log_path, "w", encoding="utf-8")
+            self._log.write(text)
+            self._log.flush()
+        except OSError:
+            # Logging is a convenience; never break the console over it.
+            self.log_path = None
+            self._log = None
@@ -8,11 +8,8 @@ from PIL import Image, ImageDraw
 from pdf2image import convert_from_path
 import matplotlib.pyplot as plt
 
-# Folders where PDFs are stored
-PDF_FOLDERS = [
-    r"C:\Users\benoi\Downloads\ebay_manuals",
-    r"C:\Users\benoi\Downloads\manuals"
-]
+from pdf_catalog import find_pdfs
+import tool_progress
 
 # Default angled cover file (the photo)
 ANGLE_COVER_FILE = "cover_angle.jpg"
@@ -23,15 +20,7 @@ ANGLE_COVER_FILE = "cover_angle.jpg"
 
 def find_pdf(partial_name):
     """Finds a PDF file in the specified folders that contains the given string (case insensitive)."""
-    partial_name_lower = partial_name.lower()
-
-    matching_files = []
-    for folder in PDF_FOLDERS:
-        if not os.path.isdir(folder):
-            continue
-        for f in os.listdir(folder):
-            if f.lower().endswith(".pdf") and partial_name_lower in f.lower():
-                matching_files.append(os.path.join(folder, f))
+    matching_files = find_pdfs(partial_name)
 
     if not matching_files:
         print(f"No PDF found containing: {partial_name}")
@@ -235,7 +224,8 @@ def main():
         print(f"Mode: flat cover, ratio={args.ratio}")
 
     base = Image.open(cover_path).convert("RGB")
-    page_img = pdf_first_page_to_image(pdf_name).convert("RGB")
+    with tool_progress.timed("render"):
+        page_img = pdf_first_page_to_image(pdf_name).convert("RGB")
 
     if args.angle:
         # Scale ratio so that 0.5 behaves like 1.0 (×2 scale)
@@ -255,8 +245,10 @@ def main():
         out_img = place_in_center(base, page_img, args.ratio)
         out_name = Path(pdf_name).with_suffix(".png").name
 
-    out_img.save(out_name, "PNG")
+    with tool_progress.timed("save"):
+        out_img.save(out_name, "PNG")
     print(f"Saved: {out_name}")
+    tool_progress.artifact(out_name, "image")
 
     if args.show:
         plt.imshow(out_img)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+job_scheduler.py
+
+Job queue behind the ManualForge.py tool buttons.
+
+Every job names the resources it needs, e.g. ["cpu", "tab:2"] for 2up.py
+or ["printer:Brother HL-L8360CDW series", "tab:1"] for myprint.py. A
+resource is limited by its class (the part before ":"): with the default
+limits, two CPU-heavy jobs run at the same time, each printer prints one
+job at a time and each console tab shows one running job. Jobs that do
+not fit wait in the queue, in submission order, and start as soon as the
+resources they need are released.
+
+The scheduler has no thread of its own: the GUI calls ready() after
+submit() and finish() and starts the jobs it returns.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Concurrent jobs allowed per resource class.
+RESOURCE_LIMITS = {
+    "cpu": 2,      # render / conversion jobs
+    "printer": 1,  # per printer name
+    "network": 2,  # eBay API calls
+    "tab": 1,      # one running job per console tab
+}
+
+
+class Job:
+    """One tool run, from queued to done/failed/cancelled."""
+
+    def __init__(self, job_id: str, label: str, resources: List[str], tab: int, **params):
+        self.job_id = job_id
+        self.label = label
+        self.resources = list(resources)
+        self.tab = tab
+        self.params = params  # whatever the GUI needs to start it
+        self.state = QUEUED
+        self.returncode: Optional[int] = None
+        self.proc = None
+        self.stopped = False  # stop requested by the user
+        self.queued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        return self.state in (QUEUED, RUNNING)
+
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def __repr__(self) -> str:
+        return f"<Job {self.job_id} {self.label} {self.state}>"
+
+
+class JobScheduler:
+    """FIFO queue with per-resource concurrency limits (GUI thread only)."""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default_limit: int = 1):
+        self.limits = dict(RESOURCE_LIMITS if limits is None else limits)
+        self.default_limit = default_limit
+        self.jobs: List[Job] = []
+        self._in_use: Dict[str, int] = {}
+
+    def limit(self, resource: str) -> int:
+        return self.limits.get(resource.split(":", 1)[0], self.default_limit)
+
+    def submit(self, job: Job) -> Job:
+        self.jobs.append(job)
+        return job
+
+    def ready(self) -> List[Job]:
+        """Mark and return the queued jobs that can start now."""
+        started = []
+        for job in self.jobs:
+            if job.state == QUEUED and self._fits(job):
+                for res in job.resources:
+                    self._in_use[res] = self._in_use.get(res, 0) + 1
+                job.state = RUNNING
+                job.started_at = time.monotonic()
+                started.append(job)
+        return started
+
+    def finish(self, job: Job, returncode: Optional[int] = None, state: Optional[str] = None) -> None:
+        """Release a running job's resources (state defaults from returncode and stopped)."""
+        if job.state != RUNNING:
+            return
+        for res in job.resources:
+            self._in_use[res] -= 1
+            if not self._in_use[res]:
+                del self._in_use[res]
+        job.returncode = returncode
+        if state is None:
+            state = CANCELLED if job.stopped else DONE if returncode == 0 else FAILED
+        job.state = state
+        job.finished_at = time.monotonic()
+
+    def cancel(self, job: Job) -> bool:
+        """Drop a queued job. Running jobs must be stopped and finished instead."""
+        if job.state != QUEUED:
+            return False
+        job.state = CANCELLED
+        return True
+
+    def blocking(self, job: Job) -> List[str]:
+        """Resources a queued job is waiting for."""
+        return [res for res in job.resources if self._in_use.get(res, 0) >= self.limit(res)]
+
+    def running(self, tab: Optional[int] = None) -> List[Job]:
+        return [j for j in self.jobs if j.state == RUNNING and (tab is None or j.tab == tab)]
+
+    def queued(self, tab: Optional[int] = None) -> List[Job]:
+        return [j for j in self.jobs if j.state == QUEUED and (tab is None or j.tab == tab)]
+
+    def latest(self, tab: int) -> Optional[Job]:
+        """The job a tab is showing: running, else first queued, else the last one."""
+        jobs = [j for j in self.jobs if j.tab == tab]
+        for state in (RUNNING, QUEUED):
+            for job in jobs:
+                if job.state == state:
+                    return job
+        return jobs[-1] if jobs else None
+
+    def prune(self, keep: int = 50) -> None:
+        """Forget the oldest finished jobs beyond `keep`."""
+        finished = [j for j in self.jobs if not j.active]
+        for job in finished[:max(0, len(finished) - keep)]:
+            self.jobs.remove(job)
+
+    def summary(self) -> str:
+        running = sum(1 for j in self.jobs if j.state == RUNNING)
+        queued = sum(1 for j in self.jobs if j.state == QUEUED)
+        return f"Jobs: {running} running, {queued} queued"
+
+    def _fits(self, job: Job) -> bool:
+        return not self.blocking(job)
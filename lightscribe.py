@@ -3,6 +3,7 @@ import os
 from PIL import Image, ImageOps, ImageEnhance, ImageDraw
 import numpy as np
 import argparse
+import tool_progress
 # import matplotlib.pyplot as plt  # uncomment if you want the preview window
 
 def main():
@@ -126,6 +127,7 @@ def main():
     output_name = "lightscribe_ebay.jpg"
     out_img.save(output_name, quality=95)
     print("Saved final image as '{}' ({} x {})".format(output_name, out_img.size[0], out_img.size[1]))
+    tool_progress.artifact(output_name, "image")
 
     # Optional preview
     # import matplotlib.pyplot as plt
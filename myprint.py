@@ -7,15 +7,12 @@ import psutil
 import json
 from pathlib import Path
 
+from pdf_catalog import find_pdfs
+import tool_progress
+
 # Path to SumatraPDF executable
 SUMATRA_PATH = r"C:\portableapps\sumatrapdf\sumatrapdf.exe"
 
-# Folders where PDFs are stored
-PDF_FOLDERS = [
-    r"C:\Users\benoi\Downloads\ebay_manuals",
-    r"C:\Users\benoi\Downloads\manuals"
-]
-
 # Available printers
 PRINTERS = {
     "1": "Brother HL-L8360CDW [Wireless]",
@@ -43,13 +40,7 @@ def select_printer():
 
 def find_pdf(partial_name):
     """Finds a PDF file in the specified folders that contains the given string (case insensitive)."""
-    partial_name_lower = partial_name.lower()
-
-    matching_files = []
-    for folder in PDF_FOLDERS:
-        for f in os.listdir(folder):
-            if f.lower().endswith(".pdf") and partial_name_lower in f.lower():
-                matching_files.append(os.path.join(folder, f))
+    matching_files = find_pdfs(partial_name)
 
     if not matching_files:
         print(f"No PDF found containing: {partial_name}")
@@ -77,6 +68,18 @@ def get_pdf_page_count(pdf_path):
         print(f"Error reading PDF: {e}")
         return None
 
+def count_setting_pages(setting):
+    """Number of pages a print setting sends (single pages and a-b ranges)."""
+    pages = 0
+    for part in setting.split(","):
+        if "-" in part and part.replace("-", "").isdigit():
+            a, b = map(int, part.split("-"))
+            pages += max(0, b - a + 1)
+            break
+        elif part.isdigit():
+            pages += 1
+    return pages
+
 def print_pdf(printer_name, partial_name):
     """Prints a PDF with predefined settings or user-defined page ranges."""
     pdf_path = find_pdf(partial_name)
@@ -160,6 +163,8 @@ def print_pdf(printer_name, partial_name):
     if printer_name == "Brother HL-L3290CDW [Wireless]":
         delay_between_batches = 480  # Delay in seconds between batches
 
+    tracker = tool_progress.Tracker(sum(count_setting_pages(st) for st in print_settings), "pages sent")
+
     for setting in print_settings:
         # Extract page range from the setting
         setting_parts = setting.split(",")
@@ -172,6 +177,7 @@ def print_pdf(printer_name, partial_name):
                 #print a single page
                 print(f"Printing page {part}")
                 subprocess.run([SUMATRA_PATH, "-print-to", printer_name1, "-print-settings", setting, pdf_path], check=True)
+                tracker.step()
                 time.sleep(10)
         if page_range:
             start_page, end_page = map(int, page_range.split("-"))
@@ -184,6 +190,7 @@ def print_pdf(printer_name, partial_name):
 
                 print(f"Printing pages {batch_range}")
                 subprocess.run([SUMATRA_PATH, "-print-to", printer_name1, "-print-settings", batch_setting, pdf_path], check=True)
+                tracker.step(batch_end - current_page + 1)
 
                 current_page += batch_size
                 if current_page <= new_page_count:
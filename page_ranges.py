@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+page_ranges.py
+
+Parser for page selections written the way print_settings.json writes
+them: comma-separated 1-based pages and inclusive ranges, e.g.
+
+    "1"          -> [1]
+    "3-34"       -> [3, 4, ..., 34]
+    "1-5,8,12-"  -> [1, 2, 3, 4, 5, 8, 12, ..., page_count]
+
+An empty selection or "all" means every page. Pages are returned in the
+order written, without duplicates.
+"""
+
+from typing import List, Optional
+
+
+def parse_page_ranges(spec: str, page_count: Optional[int] = None) -> List[int]:
+    """
+    Return the 1-based page numbers selected by spec.
+
+    Raises ValueError for malformed parts, pages below 1, reversed ranges,
+    or pages beyond page_count (when given). Open-ended ranges ("12-")
+    and "all" need page_count.
+    """
+    spec = (spec or "").strip().lower()
+    if spec in ("", "all"):
+        if page_count is None:
+            raise ValueError("'all' pages needs a page count")
+        return list(range(1, page_count + 1))
+
+    pages: List[int] = []
+    seen = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, dash, last = part.partition("-")
+        if dash and not last.strip():
+            if page_count is None:
+                raise ValueError(f"open range '{part}' needs a page count")
+            last = str(page_count)
+        try:
+            start = int(first)
+            end = int(last) if dash else start
+        except ValueError:
+            raise ValueError(f"invalid page range '{part}'") from None
+
+        if start < 1 or end < start:
+            raise ValueError(f"invalid page range '{part}'")
+        if page_count is not None and end > page_count:
+            raise ValueError(f"page range '{part}' is beyond the last page ({page_count})")
+        for page in range(start, end + 1):
+            if page not in seen:
+                seen.add(page)
+                pages.append(page)
+
+    if not pages:
+        raise ValueError("no pages selected")
+    return pages
+
+
+def format_page_ranges(pages: List[int]) -> str:
+    """Inverse of parse_page_ranges for sorted input: [1, 2, 3, 8] -> "1-3,8"."""
+    parts = []
+    run_start = prev = None
+    for page in pages:
+        if prev is not None and page == prev + 1:
+            prev = page
+            continue
+        if run_start is not None:
+            parts.append(str(run_start) if run_start == prev else f"{run_start}-{prev}")
+        run_start = prev = page
+    if run_start is not None:
+        parts.append(str(run_start) if run_start == prev else f"{run_start}-{prev}")
+    return ",".join(parts)
@@ -4,23 +4,12 @@ import fitz  # PyMuPDF
 from PIL import Image
 import sys
 
-# Folders to search for PDFs
-PDF_FOLDERS = [
-    r"C:\Users\benoi\Downloads\ebay_manuals",
-    r"C:\Users\benoi\Downloads\manuals"
-]
+from pdf_catalog import find_pdfs
+import tool_progress
 
 def find_pdf(partial_name):
     """Finds a PDF file in the specified folders that contains the given string (case insensitive)."""
-    partial_name_lower = partial_name.lower()
-
-    matching_files = []
-    for folder in PDF_FOLDERS:
-        if not os.path.isdir(folder):
-            continue
-        for f in os.listdir(folder):
-            if f.lower().endswith(".pdf") and partial_name_lower in f.lower():
-                matching_files.append(os.path.join(folder, f))
+    matching_files = find_pdfs(partial_name)
 
     if not matching_files:
         print(f"No PDF found containing: {partial_name}")
@@ -62,7 +51,8 @@ def main():
     # 4. Convert each page
     print(f"\nConverting '{pdf_path}' -> '{out_dir}/' ...")
 
-    with fitz.open(pdf_path) as doc:
+    with tool_progress.timed("convert"), fitz.open(pdf_path) as doc:
+        tracker = tool_progress.Tracker(len(doc), "pages")
         for page_num in range(len(doc)):
             page = doc.load_page(page_num)
             pix = page.get_pixmap(matrix=matrix)
@@ -70,6 +60,9 @@ def main():
             img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
             img.save(img_path, "PNG")
             print(f"  Saved {img_path}")
+            tracker.step()
+
+    tool_progress.artifact(out_dir, "folder")
 
     print("\nConversion complete.")
 
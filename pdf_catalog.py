@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+"""
+pdf_catalog.py
+
+Shared, persistent index of the PDF manuals found in PDF_FOLDERS.
+
+All tools (ManualForge.py, 2up.py, cover.py, myprint.py, pdf2png.py) look
+PDFs up by partial name through this module, so PDF_FOLDERS below is the
+only list of manual folders to edit. Instead of calling os.listdir on
+every folder for every lookup, the catalog keeps (name, size, mtime) for
+every PDF in an on-disk JSON index and answers substring queries from
+memory.
+
+A folder is only re-listed when its own mtime changed (a file was added,
+removed or renamed). Editing a PDF in place does not change the folder
+mtime, so the size/mtime stored for that file may be stale; callers that
+need an exact mtime should stat the file themselves.
+
+SearchWorker runs lookups for the GUI's live search on a background
+thread, debounced, reporting only the result of the latest query.
+
+Usage from a tool:
+    from pdf_catalog import find_pdfs
+    matches = find_pdfs("canon powershot")
+
+Command line:
+    python pdf_catalog.py            # refresh and print a summary
+    python pdf_catalog.py --rebuild  # drop the index and re-list everything
+    python pdf_catalog.py sx40       # query the index
+"""
+
+import os
+import json
+import time
+import argparse
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Folders where PDFs are stored (single source of truth for all tools).
+PDF_FOLDERS = [
+    r"C:\Users\benoi\Downloads\ebay_manuals",
+    r"C:\Users\benoi\Downloads\manuals",
+]
+
+INDEX_PATH = Path(__file__).with_name("pdf_index.json")
+INDEX_VERSION = 1
+
+# Minimum delay between two folder mtime checks. Lookups inside this window
+# are answered straight from memory (e.g. one per keystroke in the GUI).
+REFRESH_INTERVAL = 2.0
+
+# Idle time after the last keystroke before a live search runs.
+SEARCH_DEBOUNCE = 0.25
+
+
+class PdfCatalog:
+    """In-memory view of PDF_FOLDERS backed by a JSON index file."""
+
+    def __init__(self, folders: List[str], index_path: Optional[Path] = INDEX_PATH,
+                 refresh_interval: float = REFRESH_INTERVAL):
+        self.folders = list(folders)
+        self.index_path = index_path
+        self.refresh_interval = refresh_interval
+        # folder -> {"mtime": float, "files": [[name, size, mtime], ...]}
+        self._folders: Dict[str, dict] = {}
+        self._last_refresh: Optional[float] = None
+        self._lock = threading.Lock()
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Index file
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if self.index_path is None or not self.index_path.exists():
+            return
+        try:
+            with self.index_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self._folders = data.get("folders", {})
+
+    def _save(self) -> None:
+        if self.index_path is None:
+            return
+        data = {"version": INDEX_VERSION, "folders": self._folders}
+        tmp_path = self.index_path.with_suffix(".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # The index is only a cache: failing to persist it is not fatal.
+            pass
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _scan_folder(folder: str) -> List[list]:
+        files = []
+        with os.scandir(folder) as it:
+            for entry in it:
+                if not entry.name.lower().endswith(".pdf"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files.append([entry.name, st.st_size, st.st_mtime])
+        return files
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Re-list the folders whose mtime changed since the last scan.
+
+        Returns True if the index changed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (not force and self._last_refresh is not None
+                    and now - self._last_refresh < self.refresh_interval):
+                return False
+            self._last_refresh = now
+
+            changed = False
+            for folder in self.folders:
+                try:
+                    folder_mtime = os.stat(folder).st_mtime
+                except OSError:
+                    if self._folders.pop(folder, None) is not None:
+                        changed = True
+                    continue
+
+                cached = self._folders.get(folder)
+                if not force and cached is not None and cached.get("mtime") == folder_mtime:
+                    continue
+
+                try:
+                    files = self._scan_folder(folder)
+                except OSError:
+                    continue
+                self._folders[folder] = {"mtime": folder_mtime, "files": files}
+                changed = True
+
+            # Forget folders that were removed from the configuration
+            for folder in list(self._folders):
+                if folder not in self.folders:
+                    del self._folders[folder]
+                    changed = True
+
+            if changed:
+                self._save()
+            return changed
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(self, partial: str) -> List[str]:
+        """Case-insensitive contains search. Returns full paths in folder order."""
+        self.refresh()
+        partial_lower = partial.lower()
+        matches = []
+        with self._lock:
+            for folder in self.folders:
+                entry = self._folders.get(folder)
+                if entry is None:
+                    continue
+                for name, _size, _mtime in entry["files"]:
+                    if partial_lower in name.lower():
+                        matches.append(os.path.join(folder, name))
+        return matches
+
+    def entries(self) -> List[tuple]:
+        """Return (path, size, mtime) for every indexed PDF."""
+        self.refresh()
+        with self._lock:
+            return [
+                (os.path.join(folder, name), size, mtime)
+                for folder in self.folders
+                for name, size, mtime in self._folders.get(folder, {}).get("files", [])
+            ]
+
+
+class SearchWorker:
+    """
+    Debounced, cancellable search on a background thread.
+
+    submit(query) replaces any query not yet started and restarts the
+    debounce delay. The thread then calls search_fn(query, cancelled),
+    where cancelled() becomes True as soon as a newer query is submitted
+    (long searches should check it between steps and return early), and
+    reports on_result(seq, query, result) only if the query is still the
+    latest one. seq is the number returned by submit().
+    """
+
+    def __init__(self, search_fn: Callable, on_result: Callable, delay: float = SEARCH_DEBOUNCE):
+        self.search_fn = search_fn
+        self.on_result = on_result
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._pending = None  # (seq, query) waiting for the debounce delay
+        self._due = 0.0
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="pdf-search", daemon=True)
+        self._thread.start()
+
+    def submit(self, query: str) -> int:
+        with self._cond:
+            self._seq += 1
+            self._pending = (self._seq, query)
+            self._due = time.monotonic() + self.delay
+            self._cond.notify()
+            return self._seq
+
+    def cancel(self) -> int:
+        """Drop the pending query and invalidate the running one."""
+        with self._cond:
+            self._seq += 1
+            self._pending = None
+            return self._seq
+
+    def is_current(self, seq: int) -> bool:
+        with self._cond:
+            return seq == self._seq
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._pending = None
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    if self._pending is None:
+                        self._cond.wait()
+                        continue
+                    remaining = self._due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                seq, query = self._pending
+                self._pending = None
+            try:
+                result = self.search_fn(query, lambda: not self.is_current(seq))
+            except Exception:
+                result = None
+            if self.is_current(seq):
+                self.on_result(seq, query, result)
+
+
+_default_catalog: Optional[PdfCatalog] = None
+
+
+def get_catalog() -> PdfCatalog:
+    """Return the process-wide catalog for PDF_FOLDERS."""
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = PdfCatalog(PDF_FOLDERS)
+    return _default_catalog
+
+
+def find_pdfs(partial: str) -> List[str]:
+    """Case-insensitive contains search across PDF_FOLDERS (served from the index)."""
+    return get_catalog().search(partial)
+
+
+# ----------------------------------------------------------------------
+# MAIN
+# ----------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh or query the shared PDF index.")
+    parser.add_argument("query", nargs="?", help="Part of a PDF filename to look up")
+    parser.add_argument("--rebuild", action="store_true", help="Re-list every folder from scratch")
+    args = parser.parse_args()
+
+    catalog = get_catalog()
+    t0 = time.perf_counter()
+    catalog.refresh(force=args.rebuild)
+    elapsed = time.perf_counter() - t0
+
+    if args.query:
+        for path in catalog.search(args.query):
+            print(path)
+        return
+
+    entries = catalog.entries()
+    total_mb = sum(size for _path, size, _mtime in entries) / (1024 * 1024)
+    print(f"Indexed {len(entries)} PDFs ({total_mb:.1f} MB) in {elapsed:.3f} s")
+    print(f"Index file: {INDEX_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+#!/usr/bin/env python
+"""
+pdf_preview.py
+
+Caches used by the ManualForge.py preview pane.
+
+DocumentCache keeps a bounded LRU of open PyMuPDF documents so paging
+through a manual does not re-open and re-parse the PDF on every flip.
+
+RenderCache keeps the encoded preview images (PNG bytes) under a byte
+budget, with an optional on-disk tier so previews survive a restart.
+
+PrefetchWorker renders the pages around the one on screen in a background
+thread so Prev/Next paging is served from the RenderCache.
+
+ThumbnailWorker fills the thumbnail strip in the background, pages
+currently on screen first.
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+# PyMuPDF is imported on first use (see load_fitz) so that starting the
+# GUI does not pay for it; the GUI still works without previews.
+_fitz = None
+
+# Number of PDFs kept open at the same time.
+MAX_OPEN_DOCUMENTS = 4
+
+# Default budgets for encoded preview images.
+RENDER_CACHE_BYTES = 64 * 1024 * 1024
+DISK_CACHE_BYTES = 256 * 1024 * 1024
+
+# Pages rendered ahead on each side of the page on screen.
+PREFETCH_PAGES = 2
+
+def load_fitz():
+    """Import PyMuPDF on first call; return the module, or None if missing."""
+    global _fitz
+    if _fitz is None:
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            _fitz = False
+        else:
+            _fitz = fitz
+    return _fitz or None
+
+
+class DocumentCache:
+    """
+    LRU of open fitz.Document objects keyed by path and mtime.
+
+    A document whose file changed on disk is closed and re-opened. Evicted
+    documents are closed explicitly. PyMuPDF is not thread-safe, so callers
+    that use a document from several threads must hold `lock` while doing so.
+    """
+
+    def __init__(self, max_docs: int = MAX_OPEN_DOCUMENTS):
+        self.max_docs = max(1, max_docs)
+        self.lock = threading.RLock()
+        # path -> (mtime, fitz.Document)
+        self._docs = OrderedDict()
+
+    def get(self, path):
+        """Return an open document for path, or None if it cannot be opened."""
+        fitz = load_fitz()
+        if fitz is None or not path:
+            return None
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return None
+
+        with self.lock:
+            entry = self._docs.get(path)
+            if entry is not None:
+                cached_mtime, doc = entry
+                if cached_mtime == mtime:
+                    self._docs.move_to_end(path)
+                    return doc
+                # File changed on disk: drop the stale handle
+                del self._docs[path]
+                self._close(doc)
+
+            try:
+                doc = fitz.open(path)
+            except Exception:
+                return None
+            self._docs[path] = (mtime, doc)
+            while len(self._docs) > self.max_docs:
+                _path, (_mtime, old_doc) = self._docs.popitem(last=False)
+                self._close(old_doc)
+            return doc
+
+    def mtime(self, path):
+        """Return the mtime the cached document for path was opened with."""
+        with self.lock:
+            entry = self._docs.get(path)
+            return entry[0] if entry is not None else None
+
+    def close_all(self) -> None:
+        with self.lock:
+            while self._docs:
+                _path, (_mtime, doc) = self._docs.popitem(last=False)
+                self._close(doc)
+
+    @staticmethod
+    def _close(doc) -> None:
+        try:
+            doc.close()
+        except Exception:
+            pass
+
+
+class RenderCache:
+    """
+    LRU of encoded preview images keyed by (path, mtime, page, max_height).
+
+    The memory tier is bounded by max_bytes. If disk_dir is given, every
+    image is also written there (bounded by disk_max_bytes, oldest files
+    pruned first) and memory misses fall back to it.
+    """
+
+    def __init__(self, max_bytes: int = RENDER_CACHE_BYTES, disk_dir=None,
+                 disk_max_bytes: int = DISK_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._disk_bytes = None  # computed lazily on first write
+        self._lock = threading.Lock()
+        if self.disk_dir:
+            try:
+                os.makedirs(self.disk_dir, exist_ok=True)
+            except OSError:
+                self.disk_dir = None
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def _disk_path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.disk_dir, digest + ".png")
+
+    def get(self, key):
+        """Return cached bytes for key, or None. Counts hits and misses."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)
+            except OSError:
+                data = None
+            if data:
+                with self._lock:
+                    self.disk_hits += 1
+                    self.hits += 1
+                    self._store(key, data)
+                return data
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def contains(self, key) -> bool:
+        """True if key is in the memory tier (does not touch the counters)."""
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key, data: bytes) -> None:
+        if not data:
+            return
+        with self._lock:
+            self._store(key, data)
+        if self.disk_dir:
+            self._write_disk(key, data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats_text(self) -> str:
+        mb = self._bytes / (1024 * 1024)
+        return f"Cache: {self.hits} hits / {self.misses} misses ({mb:.1f} MB)"
+
+    # ------------------------------------------------------------------
+
+    def _store(self, key, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._entries[key] = data
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes and self._entries:
+            _key, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def _write_disk(self, key, data: bytes) -> None:
+        path = self._disk_path(key)
+        if os.path.exists(path):
+            return
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(data)
+            over_budget = self._disk_bytes > self.disk_max_bytes
+        if over_budget:
+            self._prune_disk()
+
+    def _scan_disk_bytes(self) -> int:
+        total = 0
+        try:
+            with os.scandir(self.disk_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".png"):
+                        total += entry.stat().st_size
+        except OSError:
+            pass
+        return total
+
+    def _prune_disk(self) -> None:
+        """Delete the least recently used files until 90% of the budget."""
+        try:
+            with os.scandir(self.disk_dir) as it:
+                files = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                         for e in it if e.name.endswith(".png")]
+        except OSError:
+            return
+        files.sort()
+        total = sum(size for _mtime, size, _path in files)
+        target = int(self.disk_max_bytes * 0.9)
+        for _mtime, size, path in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        with self._lock:
+            self._disk_bytes = total
+
+
+class PrefetchWorker:
+    """
+    Background thread that renders neighbouring pages into a cache.
+
+    render_fn(path, page_index) must render the page the same way the
+    preview does and store the result in the cache. Every call to
+    schedule() or cancel() starts a new generation: pages queued for an
+    older selection are dropped before they are rendered.
+    """
+
+    def __init__(self, render_fn, radius: int = PREFETCH_PAGES):
+        self.render_fn = render_fn
+        self.radius = radius
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._pending = []
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="preview-prefetch", daemon=True)
+        self._thread.start()
+
+    def schedule(self, path, page_index: int, page_count: int) -> None:
+        """Queue next/previous pages around page_index, nearest first."""
+        order = []
+        for distance in range(1, self.radius + 1):
+            for idx in (page_index + distance, page_index - distance):
+                if 0 <= idx < page_count:
+                    order.append((path, idx))
+        with self._cond:
+            self._generation += 1
+            self._pending = order
+            self._cond.notify()
+
+    def cancel(self) -> None:
+        with self._cond:
+            self._generation += 1
+            self._pending = []
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._pending = []
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                path, page_index = self._pending.pop(0)
+            try:
+                self.render_fn(path, page_index)
+            except Exception:
+                # Prefetch is best effort; the UI renders on demand anyway.
+                pass
+
+
+class ThumbnailWorker:
+    """
+    Background thread rendering thumbnails, reporting each one as it is done.
+
+    render_fn(path, page_index) returns the image bytes (normally served
+    from a RenderCache with a disk tier); on_done(generation, page_index,
+    data) is called from the worker thread. request() starts a new
+    generation and drops the pages still queued for the previous one.
+
+    One thread: PyMuPDF is not thread-safe, even with one document per
+    thread, so every render holds the DocumentCache lock and more threads
+    would not render any faster.
+    """
+
+    def __init__(self, render_fn, on_done):
+        self.render_fn = render_fn
+        self.on_done = on_done
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._pending = []
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="thumbnails", daemon=True)
+        self._thread.start()
+
+    def request(self, path, first: int, count: int, page_count: int, ahead: int = 0) -> int:
+        """
+        Queue pages first..first+count-1 (the visible ones), then up to
+        `ahead` pages on each side, nearest first. Returns the generation.
+        """
+        last = min(first + count, page_count)
+        order = [(path, idx) for idx in range(max(0, first), last)]
+        for distance in range(1, ahead + 1):
+            for idx in (last - 1 + distance, first - distance):
+                if 0 <= idx < page_count:
+                    order.append((path, idx))
+        with self._cond:
+            self._generation += 1
+            self._pending = order
+            self._cond.notify_all()
+            return self._generation
+
+    def cancel(self) -> None:
+        with self._cond:
+            self._generation += 1
+            self._pending = []
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._pending = []
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                generation = self._generation
+                path, page_index = self._pending.pop(0)
+            try:
+                data = self.render_fn(path, page_index)
+            except Exception:
+                data = None
+            self.on_done(generation, page_index, data)
@@ -0,0 +1,56 @@
+"""
+Both 2up.py engines must place page content at the same spot on the sheet.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+NUP_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2up.py")
+
+
+def make_cropped_pdf(path: str) -> None:
+    """Pages with a CropBox inside the MediaBox, markers inside and outside it."""
+    doc = fitz.open()
+    for rotation in (0, 90, 180, 270):
+        page = doc.new_page(width=612, height=792)
+        page.insert_text((20, 30), "TL", fontsize=14)
+        page.insert_text((100, 120), "IN", fontsize=14)
+        page.insert_text((560, 770), "BR", fontsize=14)
+        page.set_cropbox(fitz.Rect(40, 60, 500, 700))
+        page.set_rotation(rotation)
+    doc.save(path)
+    doc.close()
+
+
+def marker_positions(path: str) -> list:
+    doc = fitz.open(path)
+    try:
+        return sorted(
+            (number, word[4], round(word[0]), round(word[1]))
+            for number, page in enumerate(doc)
+            for word in page.get_text("words")
+        )
+    finally:
+        doc.close()
+
+
+@pytest.mark.parametrize("mode", ["2up", "4up"])
+def test_engines_agree_on_cropped_pages(tmp_path, mode):
+    src = str(tmp_path / "cropped.pdf")
+    make_cropped_pdf(src)
+    positions = {}
+    for engine in ("pypdf", "mupdf"):
+        out = str(tmp_path / "{}-{}.pdf".format(mode, engine))
+        subprocess.run(
+            [sys.executable, NUP_SCRIPT, src, "--manual-inputs", "-m", mode, "-o", out, "--engine", engine],
+            check=True, capture_output=True, stdin=subprocess.DEVNULL,
+        )
+        positions[engine] = marker_positions(out)
+    # The whole MediaBox is drawn, markers outside the CropBox included
+    assert {word for _, word, _, _ in positions["mupdf"]} == {"TL", "IN", "BR"}
+    assert positions["mupdf"] == positions["pypdf"]
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+"""
+tool_progress.py
+
+Machine-readable side channel between the tools and ManualForge.py.
+
+When a tool is started from the GUI, the environment carries the address
+of a local socket (MANUALFORGE_PROGRESS = "host:port:token") and a job id
+(MANUALFORGE_JOB). The tool sends JSON lines on that socket:
+
+    {"type": "progress", "done": 12, "total": 400, "label": "sheets", "eta": 31.5}
+    {"type": "artifact", "path": "C:/.../manual_2up.pdf", "kind": "pdf"}
+    {"type": "timing", "phase": "write", "seconds": 2.41}
+
+Console output is untouched. Outside the GUI (no environment variable)
+every function here is a no-op, so the tools run standalone as before.
+
+Tool side:
+    import tool_progress
+    tracker = tool_progress.Tracker(len(pages), "pages")
+    for ...:
+        tracker.step()
+    tool_progress.artifact(out_path)
+
+GUI side: ProgressServer accepts the connections and hands every decoded
+message to a callback.
+"""
+
+import os
+import json
+import time
+import socket
+import secrets
+import threading
+import contextlib
+from typing import Callable, Optional
+
+ENV_ADDRESS = "MANUALFORGE_PROGRESS"
+ENV_JOB = "MANUALFORGE_JOB"
+
+# Minimum delay between two progress messages from the same Tracker.
+MIN_INTERVAL = 0.2
+
+IMAGE_EXTS = {".png", ".jpg", ".jpeg"}
+
+# ---------------------------------------------------------------------------
+# Tool side
+# ---------------------------------------------------------------------------
+
+_sock = None
+_disabled = False
+_lock = threading.Lock()
+
+
+def _connect():
+    global _sock, _disabled
+    address = os.environ.get(ENV_ADDRESS)
+    if not address:
+        _disabled = True
+        return None
+    try:
+        host, port, _token = address.rsplit(":", 2)
+        _sock = socket.create_connection((host, int(port)), timeout=2)
+    except (OSError, ValueError):
+        _disabled = True
+        return None
+    return _sock
+
+
+def send(msg_type: str, **fields) -> None:
+    """Send one message to the GUI (no-op when not started from it)."""
+    global _disabled
+    if _disabled:
+        return
+    with _lock:
+        sock = _sock or _connect()
+        if sock is None:
+            return
+        address = os.environ.get(ENV_ADDRESS, "")
+        msg = {"type": msg_type, "job": os.environ.get(ENV_JOB), "token": address.rsplit(":", 1)[-1]}
+        msg.update(fields)
+        try:
+            sock.sendall((json.dumps(msg) + "\n").encode("utf-8"))
+        except OSError:
+            # The GUI went away: keep the tool running, just stop reporting.
+            _disabled = True
+
+
+def disable() -> None:
+    """Stop reporting from this process (e.g. pool workers of a tool that reports itself)."""
+    global _sock, _disabled
+    with _lock:
+        _disabled = True
+        _sock = None
+
+
+def progress(done: int, total: int, label: str = "", eta: Optional[float] = None) -> None:
+    send("progress", done=done, total=total, label=label, eta=eta)
+
+
+def artifact(path: str, kind: Optional[str] = None) -> None:
+    """Report an output file (kind: "image", "pdf", "folder"; guessed if omitted)."""
+    path = os.path.abspath(path)
+    if kind is None:
+        ext = os.path.splitext(path)[1].lower()
+        if os.path.isdir(path):
+            kind = "folder"
+        elif ext in IMAGE_EXTS:
+            kind = "image"
+        elif ext == ".pdf":
+            kind = "pdf"
+        else:
+            kind = "file"
+    send("artifact", path=path, kind=kind)
+
+
+def timing(phase: str, seconds: float) -> None:
+    send("timing", phase=phase, seconds=round(seconds, 3))
+
+
+@contextlib.contextmanager
+def timed(phase: str):
+    """Report how long the with-block took."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing(phase, time.perf_counter() - t0)
+
+
+class Tracker:
+    """Counts work items and reports progress with an ETA, throttled."""
+
+    def __init__(self, total: int, label: str = ""):
+        self.total = total
+        self.label = label
+        self.done = 0
+        self._start = time.perf_counter()
+        self._last_sent = 0.0
+        progress(0, total, label)
+
+    def step(self, count: int = 1) -> None:
+        self.done += count
+        now = time.perf_counter()
+        if self.done < self.total and now - self._last_sent < MIN_INTERVAL:
+            return
+        self._last_sent = now
+        elapsed = now - self._start
+        eta = None
+        if 0 < self.done < self.total:
+            eta = round(elapsed / self.done * (self.total - self.done), 1)
+        progress(self.done, self.total, self.label, eta)
+
+# ---------------------------------------------------------------------------
+# GUI side
+# ---------------------------------------------------------------------------
+
+class ProgressServer:
+    """Local socket server; calls on_message(dict) from its reader threads."""
+
+    def __init__(self, on_message: Callable[[dict], None], host: str = "127.0.0.1"):
+        self.on_message = on_message
+        self.token = secrets.token_hex(8)
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind((host, 0))
+        self._server.listen()
+        self.host, self.port = self._server.getsockname()[:2]
+        threading.Thread(target=self._accept_loop, name="progress-accept", daemon=True).start()
+
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}:{self.token}"
+
+    def env_for(self, job_id: str) -> dict:
+        """Environment variables that connect a tool to this server."""
+        return {ENV_ADDRESS: self.address, ENV_JOB: job_id}
+
+    def close(self) -> None:
+        try:
+            self._server.close()
+        except OSError:
+            pass
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn, _addr = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._read_loop, args=(conn,), daemon=True).start()
+
+    def _read_loop(self, conn) -> None:
+        with conn, conn.makefile("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    continue
+                if msg.get("token") != self.token:
+                    return
+                self.on_message(msg)
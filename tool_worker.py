@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""
+tool_worker.py
+
+Pre-warmed Python processes for the ManualForge.py tool buttons.
+
+Starting `python -u script.py` for every click pays for interpreter
+startup plus the heavy imports of the tools (numpy, PIL, pdf2image,
+matplotlib, pypdf, PyMuPDF...). A worker started from this file imports
+those modules up front and then waits for one job on stdin:
+
+    {"script": "C:/.../cover.py", "args": ["--ratio=0.50"], "cwd": "C:/..."}
+
+It runs the script with runpy as __main__, so the tool behaves exactly as
+if it had been started directly: it reads its input() answers from the
+same stdin pipe and prints to the same stdout/stderr pipes that the GUI
+console is already reading. A worker runs a single job and exits with the
+tool's exit code, so no state leaks from one tool run to the next.
+
+WorkerPool (used by the GUI) keeps a few idle workers ready and replaces
+each one as soon as it is handed a job.
+"""
+
+import os
+import sys
+import json
+import runpy
+import traceback
+import subprocess
+import contextlib
+import importlib
+from typing import Dict, List, Optional
+
+# Modules imported by the tools, loaded before a job arrives.
+WARM_MODULES = [
+    "numpy",
+    "PIL.Image",
+    "PIL.ImageDraw",
+    "PIL.ImageOps",
+    "PIL.ImageEnhance",
+    "pdf2image",
+    "matplotlib.pyplot",
+    "pypdf",
+    "PyPDF2",
+    "fitz",
+    "psutil",
+]
+
+WORKER_SCRIPT = os.path.abspath(__file__)
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def warm_up(modules: List[str] = WARM_MODULES) -> None:
+    """Import the heavy modules, silently skipping any that are missing."""
+    with open(os.devnull, "w") as devnull:
+        with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            for name in modules:
+                try:
+                    importlib.import_module(name)
+                except Exception:
+                    pass
+
+
+def run_job(job: Dict) -> None:
+    """Run one tool script as __main__ in this process."""
+    script = os.path.abspath(job["script"])
+    cwd = job.get("cwd")
+    if cwd:
+        os.chdir(cwd)
+    os.environ.update(job.get("env") or {})
+    sys.argv = [script] + list(job.get("args") or [])
+    sys.path.insert(0, os.path.dirname(script))
+    runpy.run_path(script, run_name="__main__")
+
+
+def worker_main() -> int:
+    warm_up()
+    line = sys.stdin.readline()
+    if not line.strip():
+        # Pool shut down before this worker was used.
+        return 0
+    try:
+        job = json.loads(line)
+    except ValueError:
+        print("tool_worker: invalid job line", file=sys.stderr)
+        return 2
+    try:
+        run_job(job)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    return 0
+
+# ---------------------------------------------------------------------------
+# GUI side
+# ---------------------------------------------------------------------------
+
+class WorkerPool:
+    """Keep `size` idle pre-warmed workers and hand them out one job each."""
+
+    def __init__(self, size: int = 2, env: Optional[Dict[str, str]] = None,
+                 python: str = sys.executable):
+        self.size = max(0, size)
+        self.env = env
+        self.python = python
+        self._idle: List[subprocess.Popen] = []
+
+    def command(self, script_path: str, extra_args: List[str]) -> List[str]:
+        """The equivalent direct command line (for display)."""
+        return [self.python, "-u", script_path] + list(extra_args or [])
+
+    def fill(self) -> None:
+        self._idle = [p for p in self._idle if p.poll() is None]
+        while len(self._idle) < self.size:
+            self._idle.append(self._spawn())
+
+    def run(self, script_path: str, extra_args: List[str], cwd: Optional[str] = None,
+            env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+        """Start script_path on a warm worker and return its process."""
+        proc = self._acquire()
+        job = {
+            "script": script_path,
+            "args": list(extra_args or []),
+            "cwd": cwd or os.getcwd(),
+            "env": env or {},
+        }
+        proc.stdin.write((json.dumps(job) + "\n").encode("utf-8"))
+        proc.stdin.flush()
+        # replace the worker we just used
+        self.fill()
+        return proc
+
+    def shutdown(self) -> None:
+        for proc in self._idle:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+        for proc in self._idle:
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                proc.terminate()
+        self._idle = []
+
+    def _acquire(self) -> subprocess.Popen:
+        while self._idle:
+            proc = self._idle.pop(0)
+            if proc.poll() is None:
+                return proc
+        return self._spawn()
+
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            [self.python, "-u", WORKER_SCRIPT],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            bufsize=0,
+            env=self.env,
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(worker_main())